@@ -0,0 +1,90 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+import contextlib
+import re
+
+import pytest
+
+
+class SshConnectionPool:
+    """Caches one open SSH connection per username for the whole test session.
+
+    The SSH handshake (KEX, auth) dominates trivial remote commands, so tests
+    share connections instead of reconnecting per test.
+    """
+
+    def __init__(self):
+        self._stack = contextlib.ExitStack()
+        self._connections = {}
+
+    def get_or_open(self, target, username=None):
+        """Return the pooled connection for username, opening it on first use."""
+        if username not in self._connections:
+            context = target.ssh() if username is None else target.ssh(username=username)
+            self._connections[username] = self._stack.enter_context(context)
+        return self._connections[username]
+
+    def close_all(self):
+        self._stack.close()
+        self._connections.clear()
+
+
+@pytest.fixture(scope="session")
+def ssh_pool():
+    pool = SshConnectionPool()
+    yield pool
+    pool.close_all()
+
+
+_RC_MARKER = "__ITF_RC__"
+# A marker line is exactly the marker plus the exit code; anything else on
+# the line means it came from command output, not from our printf
+_RC_LINE_RE = re.compile(rf"^{_RC_MARKER}(\d+)$")
+
+
+def _remote_multi(target, cmds):
+    """Run several commands on the target in a single round-trip.
+
+    The commands are joined into one shell invocation with an exit-code
+    marker printed after each, so N related checks cost one remote execution
+    instead of N. Each command runs in its own subshell, matching the
+    per-execute isolation this helper replaces: an 'exit' or trailing '&'
+    affects only that command, never the batch script or later markers.
+    The combined output is parsed back locally.
+
+    Returns:
+        List of (exit_code, output) tuples, one per command.
+    """
+    # The leading newline in the printf keeps the marker at the start of its
+    # own line even when a command's output has no trailing newline, so the
+    # line-anchored parse below cannot be fooled by output containing the
+    # marker string mid-line
+    script = " ".join(f"( {cmd} ); printf '\\n{_RC_MARKER}%s\\n' $?;" for cmd in cmds)
+    _, out = target.execute(script)
+    text = out.decode(errors="replace") if isinstance(out, bytes) else str(out)
+
+    results = []
+    current: list = []
+    for line in text.splitlines():
+        if match := _RC_LINE_RE.match(line):
+            results.append((int(match.group(1)), "\n".join(current)))
+            current = []
+        else:
+            current.append(line)
+    return results
+
+
+@pytest.fixture
+def remote_multi():
+    return _remote_multi
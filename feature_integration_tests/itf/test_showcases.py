@@ -22,12 +22,20 @@ def test_ipc_bridge_cpp_app_is_deployed(target):
     assert exit_code == 0
 
 
-def test_ipc_bridge_cpp_app_is_running(target):
-    exit_code, out = target.execute(
-        "cd /showcases/data/comm; /showcases/bin/ipc_bridge_cpp -n 10 -t 100 -m send & /showcases/bin/ipc_bridge_cpp -n 5 -t 100 -m recv"
+def test_ipc_bridge_cpp_app_is_running(target, remote_multi):
+    # Batch the binary check and the send/recv run into one remote invocation
+    results = remote_multi(
+        target,
+        [
+            "test -f /showcases/bin/ipc_bridge_cpp",
+            "cd /showcases/data/comm; /showcases/bin/ipc_bridge_cpp -n 10 -t 100 -m send & /showcases/bin/ipc_bridge_cpp -n 5 -t 100 -m recv",
+        ],
     )
+    deployed_code, _ = results[0]
+    run_code, out = results[1]
     logger.info(out)
-    assert exit_code == 0
+    assert deployed_code == 0
+    assert run_code == 0
 
 
 def test_run_all_showcases(target):
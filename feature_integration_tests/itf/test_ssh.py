@@ -15,21 +15,21 @@ import score.itf
 
 
 @score.itf.plugins.core.requires_capabilities("ssh")
-def test_ssh_with_default_user(target):
-    with target.ssh() as ssh:
-        exit_code, stdout, stderr = ssh.execute_command_output("echo 'Username:' $USER && uname -a")
-        assert exit_code == 0, "SSH command failed"
-        assert "Username: root" in stdout[0], "Expected username not found in output"
-        assert "QNX Qnx_S-core 8.0.0" in stdout[1], "Expected QNX kernel information not found in output"
-        assert stderr == [], "Expected no error output"
+def test_ssh_with_default_user(target, ssh_pool):
+    ssh = ssh_pool.get_or_open(target)
+    exit_code, stdout, stderr = ssh.execute_command_output("echo 'Username:' $USER && uname -a")
+    assert exit_code == 0, "SSH command failed"
+    assert "Username: root" in stdout[0], "Expected username not found in output"
+    assert "QNX Qnx_S-core 8.0.0" in stdout[1], "Expected QNX kernel information not found in output"
+    assert stderr == [], "Expected no error output"
 
 
 @score.itf.plugins.core.requires_capabilities("ssh")
-def test_ssh_with_qnx_user(target):
+def test_ssh_with_qnx_user(target, ssh_pool):
     user = "qnxuser"
-    with target.ssh(username=user) as ssh:
-        exit_code, stdout, stderr = ssh.execute_command_output("echo 'Username:' $USER && uname -a")
-        assert exit_code == 0, "SSH command failed"
-        assert f"Username: {user}" in stdout[0], "Expected username not found in output"
-        assert "QNX Qnx_S-core 8.0.0" in stdout[1], "Expected QNX kernel information not found in output"
-        assert stderr == [], "Expected no error output"
+    ssh = ssh_pool.get_or_open(target, username=user)
+    exit_code, stdout, stderr = ssh.execute_command_output("echo 'Username:' $USER && uname -a")
+    assert exit_code == 0, "SSH command failed"
+    assert f"Username: {user}" in stdout[0], "Expected username not found in output"
+    assert "QNX Qnx_S-core 8.0.0" in stdout[1], "Expected QNX kernel information not found in output"
+    assert stderr == [], "Expected no error output"
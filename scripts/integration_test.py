@@ -17,12 +17,16 @@ Captures warning counts for regression tracking and generates build summaries.
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
 import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -33,57 +37,242 @@ from known_good.models.known_good import load_known_good
 
 repo_root = Path(__file__).parent.parent
 
+# Compiled once; matched for every module when resolving commit hashes to tags
+_GH_URL_RE = re.compile(r"github\.com[/:]([^/]+)/([^/.]+)(\.git)?$")
 
-def get_module_version_gh(repo_url: str, commit_hash: str) -> Optional[str]:
-    """Get version tag from GitHub API for a commit hash.
+# On-disk cache for tag listings so CI re-runs within the TTL skip the API entirely
+_TAG_CACHE_PATH = Path("_logs/gh_tag_cache.json")
+_TAG_CACHE_TTL_SECONDS = 3600
+
+
+@functools.lru_cache(maxsize=1)
+def _have_gh() -> bool:
+    """Probe for the gh CLI once instead of shelling out 'which gh' per call."""
+    return shutil.which("gh") is not None
+
+
+def _load_tag_cache() -> Optional[Dict[str, Dict]]:
+    """Load the persisted tag cache; each entry carries its own fetch time."""
+    try:
+        with open(_TAG_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _store_tag_cache(owner_repo: str, tags: Dict[str, str]) -> None:
+    """Persist the tag listing for one repo, keeping entries from other repos."""
+    cache = _load_tag_cache() or {}
+    cache[owner_repo] = {"fetched_at": time.time(), "tags": tags}
+    try:
+        _TAG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_TAG_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _fetch_tags_http(owner_repo: str, token: str) -> Dict[str, str]:
+    """Fetch the tag listing for a repo directly over the GitHub REST API.
+
+    Avoids the fork/exec and CLI startup cost of 'gh' entirely when a token
+    is available in the environment.
 
     Args:
-        repo_url: GitHub repository URL
-        commit_hash: Commit hash to look up
+        owner_repo: Repository in 'owner/repo' form
+        token: GitHub token used as bearer auth
 
     Returns:
-        Tag name if found, None otherwise
+        Mapping of commit sha to tag name (first tag wins)
     """
-    # Check if gh CLI is installed
-    if not subprocess.run(["which", "gh"], capture_output=True).returncode == 0:
-        print("::warning::gh CLI not found. Install it to resolve commit hashes to tags.")
-        return None
+    request = urllib.request.Request(
+        f"https://api.github.com/repos/{owner_repo}/tags?per_page=100",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=30) as resp:
+        data = json.load(resp)
 
-    # Extract owner/repo from GitHub URL
-    match = re.search(r"github\.com[/:]([^/]+)/([^/.]+)(\.git)?$", repo_url)
-    if not match:
-        print(f"::warning::Invalid repo URL format: {repo_url}")
-        return None
+    tags: Dict[str, str] = {}
+    for entry in data:
+        sha = (entry.get("commit") or {}).get("sha")
+        name = entry.get("name")
+        if sha and name:
+            tags.setdefault(sha, name)
+    return tags
 
-    owner, repo = match.group(1), match.group(2)
 
-    print(f"::debug::Querying GitHub API: repos/{owner}/{repo}/tags for commit {commit_hash}")
+@functools.lru_cache(maxsize=None)
+def _list_repo_tags(owner: str, repo: str) -> Dict[str, str]:
+    """List all tags of a repository as a {commit_sha: tag_name} mapping.
+
+    Results are memoized per (owner, repo) so each repository is queried at
+    most once per run, and persisted to disk so re-runs within the TTL reuse
+    the listing without any API call.
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
 
+    Returns:
+        Mapping of commit sha to tag name (first tag wins), empty on error
+    """
+    owner_repo = f"{owner}/{repo}"
+    cache = _load_tag_cache()
+    if cache is not None:
+        # Freshness is tracked per entry, not via the file mtime: the file is
+        # rewritten whenever any repo is stored, which would otherwise keep
+        # every entry "fresh" forever under frequent runs
+        entry = cache.get(owner_repo)
+        if entry and time.time() - entry.get("fetched_at", 0) < _TAG_CACHE_TTL_SECONDS:
+            return entry.get("tags", {})
+
+    print(f"::debug::Querying GitHub API: repos/{owner_repo}/tags")
+
+    # Prefer a direct HTTP request over spawning the gh CLI when a token exists
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        try:
+            tags = _fetch_tags_http(owner_repo, token)
+            _store_tag_cache(owner_repo, tags)
+            return tags
+        except Exception as e:
+            print(f"::warning::Direct GitHub API request failed, falling back to gh: {e}")
+
+    tags: Dict[str, str] = {}
     try:
         result = subprocess.run(
             [
                 "gh",
                 "api",
-                f"repos/{owner}/{repo}/tags",
+                f"repos/{owner_repo}/tags",
+                "--paginate",
                 "--jq",
-                f'.[] | select(.commit.sha == "{commit_hash}") | .name',
+                r'.[] | "\(.commit.sha) \(.name)"',
             ],
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=30,
         )
+        if result.returncode != 0:
+            # Don't persist a failed lookup: caching the empty mapping would
+            # pin "no tags" for the whole TTL after a transient API error
+            print(f"::warning::gh api repos/{owner_repo}/tags failed: {result.stderr.strip()}")
+            return tags
+        for line in result.stdout.splitlines():
+            sha, _, name = line.partition(" ")
+            if sha and name:
+                tags.setdefault(sha, name)
+    except Exception as e:
+        print(f"::warning::Error querying GitHub API: {e}")
+        return tags
 
-        if result.returncode == 0 and result.stdout.strip():
-            tag = result.stdout.strip().split("\n")[0]
-            print(f"::debug::Found tag: {tag}")
-            return tag
+    _store_tag_cache(owner_repo, tags)
+    return tags
 
-        print(f"::debug::No tag found for commit {commit_hash}")
-        return None
+
+def flatten_modules(modules: Dict[str, Dict[str, Module]]) -> Dict[str, Module]:
+    """Flatten the grouped known_good module structure into {module_name: Module}."""
+    return {name: module for group_modules in modules.values() for name, module in group_modules.items()}
+
+
+def prefetch_tags(*module_dicts: Dict[str, Module]) -> Dict[Tuple[str, str], str]:
+    """Resolve tags for all referenced repos with a single GraphQL round-trip.
+
+    Instead of one 'gh api' subprocess per module, build one aliased GraphQL
+    query covering every unique repository and fetch its tag refs in one call.
+
+    Args:
+        module_dicts: One or more {module_name: Module} mappings
+
+    Returns:
+        Mapping of (repo_url, commit_sha) to tag name; empty on any failure
+    """
+    repos: Dict[str, str] = {}  # owner_repo -> repo_url
+    for modules in module_dicts:
+        for module in modules.values():
+            if not module.repo or not module.hash:
+                continue
+            try:
+                repos.setdefault(module.owner_repo, module.repo)
+            except ValueError:
+                continue
+
+    if not repos:
+        return {}
+
+    if not _have_gh():
+        return {}
+
+    fields = []
+    for i, owner_repo in enumerate(repos):
+        owner, _, name = owner_repo.partition("/")
+        fields.append(
+            f'r{i}: repository(owner: "{owner}", name: "{name}") '
+            '{ refs(refPrefix: "refs/tags/", first: 100) { nodes { name target { oid } } } }'
+        )
+    query = "query { " + " ".join(fields) + " }"
+
+    print(f"::debug::Prefetching tags for {len(repos)} repo(s) via GraphQL")
+
+    try:
+        result = subprocess.run(
+            ["gh", "api", "graphql", "-f", f"query={query}"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode != 0:
+            print(f"::warning::GraphQL tag prefetch failed: {result.stderr.strip()}")
+            return {}
+        data = json.loads(result.stdout).get("data") or {}
     except Exception as e:
-        print(f"::warning::Error querying GitHub API: {e}")
+        print(f"::warning::Error prefetching tags via GraphQL: {e}")
+        return {}
+
+    lookup: Dict[Tuple[str, str], str] = {}
+    for i, repo_url in enumerate(repos.values()):
+        refs = (data.get(f"r{i}") or {}).get("refs") or {}
+        for node in refs.get("nodes") or []:
+            oid = (node.get("target") or {}).get("oid")
+            if oid and node.get("name"):
+                lookup.setdefault((repo_url, oid), node["name"])
+    return lookup
+
+
+def get_module_version_gh(repo_url: str, commit_hash: str) -> Optional[str]:
+    """Get version tag from GitHub API for a commit hash.
+
+    Args:
+        repo_url: GitHub repository URL
+        commit_hash: Commit hash to look up
+
+    Returns:
+        Tag name if found, None otherwise
+    """
+    # Check if gh CLI is installed
+    if not _have_gh():
+        print("::warning::gh CLI not found. Install it to resolve commit hashes to tags.")
         return None
 
+    # Extract owner/repo from GitHub URL
+    match = _GH_URL_RE.search(repo_url)
+    if not match:
+        print(f"::warning::Invalid repo URL format: {repo_url}")
+        return None
+
+    owner, repo = match.group(1), match.group(2)
+
+    tag = _list_repo_tags(owner, repo).get(commit_hash)
+    if tag:
+        print(f"::debug::Found tag: {tag}")
+        return tag
+
+    print(f"::debug::No tag found for commit {commit_hash}")
+    return None
+
 
 def truncate_hash(hash_str: str, length: int = 8) -> str:
     """Truncate hash to specified length.
@@ -100,32 +289,39 @@ def truncate_hash(hash_str: str, length: int = 8) -> str:
     return hash_str
 
 
-def count_pattern(log_file: Path, pattern: str) -> int:
-    """Count lines matching pattern in log file.
+def get_identifier_and_link_cheap(module: Optional[Module]) -> Tuple[Optional[str], str]:
+    """Get display identifier and link for a module without any network access.
+
+    Uses the version when present and falls back to the truncated hash,
+    which is acceptable for rows whose hash did not change.
 
     Args:
-        log_file: Path to log file
-        pattern: Pattern to search for (case-insensitive)
+        module: Module instance or None
 
     Returns:
-        Number of matching lines found
+        Tuple of (identifier, link_url)
     """
-    if not log_file.exists():
-        return 0
+    if not module or not module.hash:
+        return None, ""
 
-    count = 0
-    with open(log_file, "r") as f:
-        for line in f:
-            if pattern in line.lower():
-                count += 1
-    return count
+    if module.version:
+        identifier = module.version
+        link = f"{module.repo}/releases/tag/{module.version}" if module.repo else ""
+    else:
+        identifier = truncate_hash(module.hash)
+        link = f"{module.repo}/tree/{module.hash}" if module.repo else ""
+
+    return identifier, link
 
 
-def get_identifier_and_link(module: Optional[Module]) -> Tuple[Optional[str], str]:
+def get_identifier_and_link(
+    module: Optional[Module], tag_lookup: Optional[Dict[Tuple[str, str], str]] = None
+) -> Tuple[Optional[str], str]:
     """Get display identifier and link for a module.
 
     Args:
         module: Module instance or None
+        tag_lookup: Optional prefetched {(repo_url, sha): tag} mapping
 
     Returns:
         Tuple of (identifier, link_url)
@@ -137,9 +333,11 @@ def get_identifier_and_link(module: Optional[Module]) -> Tuple[Optional[str], st
         identifier = module.version
         link = f"{module.repo}/releases/tag/{module.version}" if module.repo else ""
     else:
-        # Try to get version from GitHub
+        # Try to get version from GitHub, preferring the prefetched lookup
         if module.repo:
-            gh_version = get_module_version_gh(module.repo, module.hash)
+            gh_version = (tag_lookup or {}).get((module.repo, module.hash))
+            if not gh_version:
+                gh_version = get_module_version_gh(module.repo, module.hash)
             if gh_version:
                 identifier = gh_version
                 link = f"{module.repo}/releases/tag/{gh_version}"
@@ -153,41 +351,76 @@ def get_identifier_and_link(module: Optional[Module]) -> Tuple[Optional[str], st
     return identifier, link
 
 
-def build_group(group_name: str, targets: str, config: str, log_file: Path) -> Tuple[int, int]:
+def build_group(
+    group_name: str,
+    targets: str,
+    config: str,
+    log_file: Path,
+    patterns: Tuple[str, ...] = ("warning:", "deprecated"),
+    jobs: Optional[int] = None,
+) -> Tuple[int, int, Dict[str, int]]:
     """Build a group of Bazel targets.
 
+    Pattern occurrences are tallied while the output streams by, so the
+    (potentially huge) log never needs a second full read for counting.
+
     Args:
         group_name: Name of the build group
         targets: Bazel targets to build
         config: Bazel config to use
         log_file: Path to log file
+        patterns: Patterns to count (case-insensitive) in the build output
+        jobs: Optional --jobs value to limit bazel's own parallelism
 
     Returns:
-        Tuple of (exit_code, duration_seconds)
+        Tuple of (exit_code, duration_seconds, pattern_counts)
     """
     print(f"--- Building group: {group_name} ---")
 
     # Build command
-    cmd = ["bazel", "build", "--verbose_failures", f"--config={config}"] + targets.split()
+    cmd = ["bazel", "build", "--verbose_failures", f"--config={config}"]
+    if jobs:
+        cmd.append(f"--jobs={jobs}")
+    cmd += targets.split()
 
     print(f"bazel build --verbose_failures --config {config} {targets}")
     print(f"::group::Bazel build ({group_name})")
 
     start_time = time.time()
-
-    # Run build and capture output
-    with open(log_file, "w") as f:
+    counts = dict.fromkeys(patterns, 0)
+    needles = {pattern: pattern.lower().encode() for pattern in patterns}
+    # Keep enough bytes from the previous chunk to catch matches split across reads
+    tail_len = max(len(needle) for needle in needles.values()) - 1
+
+    # Run build and capture raw bytes: no per-line decode, and 64 KiB writes
+    # instead of one syscall per log line
+    with open(log_file, "wb") as f:
         # Write command to log file
-        f.write(f"Command: {' '.join(cmd)}\n")
-        f.write("-" * 80 + "\n\n")
+        f.write(f"Command: {' '.join(cmd)}\n".encode())
+        f.write(b"-" * 80 + b"\n\n")
 
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
-        # Stream output to both terminal and file
+        # Stream output to both terminal and file, counting patterns in-flight.
+        # Flush text-level stdout first so the group header above lands before
+        # the raw bytes written through the underlying buffer
+        sys.stdout.flush()
+        stdout = sys.stdout.buffer
+        tail = b""
         if process.stdout:
-            for line in process.stdout:
-                print(line, end="")
-                f.write(line)
+            while chunk := process.stdout.read1(65536):
+                stdout.write(chunk)
+                stdout.flush()
+                f.write(chunk)
+                prev_tail = tail.lower()
+                window = (tail + chunk).lower()
+                for pattern, needle in needles.items():
+                    # Subtract matches fully inside the carried tail; those were
+                    # already counted in the previous iteration
+                    counts[pattern] += window.count(needle) - prev_tail.count(needle)
+                # Extend the carry with the old tail so short reads still
+                # preserve tail_len bytes of context across iterations
+                tail = (tail + chunk)[-tail_len:] if tail_len > 0 else b""
 
         process.wait()
 
@@ -196,16 +429,22 @@ def build_group(group_name: str, targets: str, config: str, log_file: Path) -> T
 
     print("::endgroup::")
 
-    return process.returncode, duration
+    return process.returncode, duration, counts
 
 
-def format_commit_version_cell(group_name: str, old_modules: Dict[str, Module], new_modules: Dict[str, Module]) -> str:
+def format_commit_version_cell(
+    group_name: str,
+    old_modules: Dict[str, Module],
+    new_modules: Dict[str, Module],
+    tag_lookup: Optional[Dict[Tuple[str, str], str]] = None,
+) -> str:
     """Format the commit/version cell for the summary table.
 
     Args:
         group_name: Name of the module group
         old_modules: Modules from old known_good.json
         new_modules: Modules from new known_good.json
+        tag_lookup: Optional prefetched {(repo_url, sha): tag} mapping
 
     Returns:
         Formatted markdown cell content
@@ -225,14 +464,17 @@ def format_commit_version_cell(group_name: str, old_modules: Dict[str, Module],
         f"repo={new_module.repo}"
     )
 
-    # Get identifiers and links
-    old_identifier, old_link = get_identifier_and_link(old_module)
-
     # Check if hash changed
     hash_changed = old_module is None or old_module.hash != new_module.hash
 
-    # Determine new identifier only if hash changed
-    new_identifier, new_link = (None, "") if not hash_changed else get_identifier_and_link(new_module)
+    # Only resolve identifiers over the network when the hash changed; for
+    # unchanged rows the cheap version/truncated-hash form is sufficient
+    if hash_changed:
+        old_identifier, old_link = get_identifier_and_link(old_module, tag_lookup)
+        new_identifier, new_link = get_identifier_and_link(new_module, tag_lookup)
+    else:
+        old_identifier, old_link = get_identifier_and_link_cheap(old_module)
+        new_identifier, new_link = None, ""
 
     # Format output
     if hash_changed:
@@ -255,6 +497,32 @@ def format_commit_version_cell(group_name: str, old_modules: Dict[str, Module],
         return "N/A"
 
 
+def precompute_cells(
+    group_names,
+    old_modules: Dict[str, Module],
+    new_modules: Dict[str, Module],
+    tag_lookup: Optional[Dict[Tuple[str, str], str]] = None,
+) -> Dict[str, str]:
+    """Precompute the commit/version cell for every build group.
+
+    Resolving identifiers once up front keeps the per-group build loop down
+    to a dict lookup and moves any residual network fallback out of it.
+
+    Args:
+        group_names: Iterable of build group names
+        old_modules: Modules from old known_good.json
+        new_modules: Modules from new known_good.json
+        tag_lookup: Optional prefetched {(repo_url, sha): tag} mapping
+
+    Returns:
+        Mapping of group name to formatted markdown cell
+    """
+    return {
+        group_name: format_commit_version_cell(group_name, old_modules, new_modules, tag_lookup)
+        for group_name in group_names
+    }
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -302,27 +570,26 @@ def main():
 
     # Load modules from known_good files
     try:
-        old_modules = load_known_good(Path("known_good.json")).modules if Path("known_good.json").exists() else {}
+        old_modules = (
+            flatten_modules(load_known_good(Path("known_good.json")).modules)
+            if Path("known_good.json").exists()
+            else {}
+        )
     except FileNotFoundError:
         old_modules = {}
 
     try:
-        new_modules = load_known_good(known_good_file).modules if known_good_file else {}
+        new_modules = flatten_modules(load_known_good(known_good_file).modules) if known_good_file else {}
     except FileNotFoundError as e:
         raise SystemExit(f"ERROR: {e}")
 
+    # Resolve tags for all referenced repos in one batched GraphQL call and
+    # precompute every group's commit/version cell before the build loop
+    tag_lookup = prefetch_tags(old_modules, new_modules)
+    cell_cache = precompute_cells(BUILD_TARGET_GROUPS, old_modules, new_modules, tag_lookup)
+
     # Start summary
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(summary_file, "w") as f:
-        f.write(f"=== Integration Build Started {timestamp} ===\n")
-        f.write(f"Config: {config}\n")
-        if known_good_file:
-            f.write(f"Known Good File: {known_good_file}\n")
-        f.write("\n")
-        f.write("## Build Groups Summary\n")
-        f.write("\n")
-        f.write("| Group | Status | Duration (s) | Warnings | Deprecated refs | Commit/Version |\n")
-        f.write("|-------|--------|--------------|----------|-----------------|----------------|\n")
 
     print(f"=== Integration Build Started {timestamp} ===")
     print(f"Config: {config}")
@@ -333,36 +600,67 @@ def main():
     overall_depr_total = 0
     any_failed = False
 
-    # Build each group
-    for group_name, module_config in BUILD_TARGET_GROUPS.items():
-        log_file = log_dir / f"{group_name}-{config}.log"
-
-        exit_code, duration = build_group(group_name, module_config.build_targets, config, log_file)
+    # Number of groups to build concurrently; bazel serializes on the workspace
+    # lock within one output base, so this stays opt-in via the environment
+    max_workers = max(1, int(os.environ.get("BAZEL_PARALLEL_GROUPS", "1")))
+    jobs = max(1, (os.cpu_count() or 1) // max_workers) if max_workers > 1 else None
 
-        if exit_code != 0:
-            any_failed = True
-
-        # Count warnings and deprecated
-        warn_count = count_pattern(log_file, "warning:")
-        depr_count = count_pattern(log_file, "deprecated")
-        overall_warn_total += warn_count
-        overall_depr_total += depr_count
-
-        # Format status
-        status_symbol = "✅" if exit_code == 0 else f"❌({exit_code})"
-
-        # Format commit/version cell
-        commit_version_cell = format_commit_version_cell(group_name, old_modules, new_modules)
-
-        # Append row to summary
-        row = f"| {group_name} | {status_symbol} | {duration} | {warn_count} | {depr_count} | {commit_version_cell} |\n"
-        with open(summary_file, "a") as f:
-            f.write(row)
-        print(row.strip())
+    def run_group(group_name: str, module_config: BuildModuleConfig) -> Tuple[str, int, int, Dict[str, int]]:
+        log_file = log_dir / f"{group_name}-{config}.log"
+        exit_code, duration, pattern_counts = build_group(
+            group_name, module_config.build_targets, config, log_file, jobs=jobs
+        )
+        return group_name, exit_code, duration, pattern_counts
 
-    # Append totals
-    with open(summary_file, "a") as f:
-        f.write(f"| TOTAL |  |  | {overall_warn_total} | {overall_depr_total} |  |\n")
+    # Keep the summary file open for the whole build instead of reopening per row
+    with open(summary_file, "w", buffering=1 << 16) as summary:
+        summary.write(f"=== Integration Build Started {timestamp} ===\n")
+        summary.write(f"Config: {config}\n")
+        if known_good_file:
+            summary.write(f"Known Good File: {known_good_file}\n")
+        summary.write("\n")
+        summary.write("## Build Groups Summary\n")
+        summary.write("\n")
+        summary.write("| Group | Status | Duration (s) | Warnings | Deprecated refs | Commit/Version |\n")
+        summary.write("|-------|--------|--------------|----------|-----------------|----------------|\n")
+
+        # Build each group, bounded by max_workers; rows are collected per
+        # group and written once at the end so the table keeps the configured
+        # group order regardless of completion order
+        rows_by_group: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_group, name, module_config) for name, module_config in BUILD_TARGET_GROUPS.items()
+            ]
+
+            for future in as_completed(futures):
+                group_name, exit_code, duration, pattern_counts = future.result()
+
+                if exit_code != 0:
+                    any_failed = True
+
+                # Warnings and deprecated were counted while the output streamed
+                warn_count = pattern_counts["warning:"]
+                depr_count = pattern_counts["deprecated"]
+                overall_warn_total += warn_count
+                overall_depr_total += depr_count
+
+                # Format status
+                status_symbol = "✅" if exit_code == 0 else f"❌({exit_code})"
+
+                # Commit/version cell was precomputed before the build loop
+                commit_version_cell = cell_cache.get(group_name, "N/A")
+
+                row = (
+                    f"| {group_name} | {status_symbol} | {duration} | {warn_count} | {depr_count} "
+                    f"| {commit_version_cell} |\n"
+                )
+                rows_by_group[group_name] = row
+                print(row.strip())
+
+        # Emit all rows and totals in one write
+        summary.write("".join(rows_by_group[name] for name in BUILD_TARGET_GROUPS if name in rows_by_group))
+        summary.write(f"| TOTAL |  |  | {overall_warn_total} | {overall_depr_total} |  |\n")
 
     # Print summary
     print("::group::Build Summary")
@@ -37,32 +37,22 @@ def main():
     # Load known_good using KnownGood dataclass
     try:
         known_good = load_known_good(Path(args.known_good))
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ValueError) as e:
         raise SystemExit(f"ERROR: {e}")
-    except ValueError as e:
-        raise SystemExit(f"ERROR: {e}")
-
-    modules = [module for group in known_good.modules.values() for module in group.values()]
-
-    gita_metadata = []
-    for module in modules:
-        if not module.repo:
-            raise RuntimeError(f"Module {module.name}: repo must not be empty")
 
-        # if no hash is given, use branch
-        hash_value = module.hash if module.hash else module.branch
+    modules = known_good.all_modules()
 
-        # workspace_path is not available in known_good.json, default to name of repository
-        workspace_path = module.name
+    for m in modules:
+        if not m.repo:
+            raise RuntimeError(f"Module {m.name}: repo must not be empty")
 
-        # gita format: {url},{name},{path},{prop['type']},{repo_flags},{branch}
-        row = [module.repo, module.name, workspace_path, "", "", hash_value]
-        gita_metadata.append(row)
+    # gita format: {url},{name},{path},{prop['type']},{repo_flags},{branch}
+    # workspace_path is not available in known_good.json, default to name of repository;
+    # if no hash is given, use branch
+    gita_metadata = [[m.repo, m.name, m.name, "", "", m.hash or m.branch] for m in modules]
 
     with open(args.gita_workspace, "w", newline="") as f:
-        writer = csv.writer(f)
-        for row in gita_metadata:
-            writer.writerow(row)
+        csv.writer(f).writerows(gita_metadata)
 
 
 if __name__ == "__main__":
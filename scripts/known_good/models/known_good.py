@@ -16,14 +16,20 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from .module import Module
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class KnownGood:
     """Known good configuration with modules and metadata.
 
@@ -32,6 +38,22 @@ class KnownGood:
 
     modules: Dict[str, Dict[str, Module]]
     timestamp: str
+    _flat_modules: Optional[List[Module]] = field(default=None, init=False, repr=False)
+
+    def all_modules(self) -> List[Module]:
+        """Return a flattened list of all modules across groups.
+
+        The list is built once and cached; consumers that only need the
+        modules (update scripts, CSV export) avoid re-walking the nested
+        group dict on every use. Module entries are parsed once and never
+        added or removed afterwards, so no invalidation is needed.
+
+        Returns:
+                List of Module instances in group order
+        """
+        if self._flat_modules is None:
+            self._flat_modules = [module for group in self.modules.values() for module in group.values()]
+        return self._flat_modules
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> KnownGood:
@@ -78,8 +100,11 @@ class KnownGood:
                 dry_run: If True, print instead of writing
         """
 
-        # Update timestamp before writing
-        self.timestamp = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat() + "Z"
+        # Update timestamp before writing. isoformat() on an aware UTC
+        # datetime ends in "+00:00"; replacing that with "Z" yields the
+        # compact form the override script already emits, instead of the
+        # doubled "+00:00Z" suffix the old concatenation produced
+        self.timestamp = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
         output_json = json.dumps(self.to_dict(), indent=4, sort_keys=False) + "\n"
 
@@ -89,8 +114,17 @@ class KnownGood:
             print(output_json, end="")
             print("---- END UPDATED JSON ----")
         else:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(output_json)
+            # Write to a sibling tmp file and rename into place: os.replace is
+            # atomic on the same filesystem, so readers never observe a
+            # half-written file even if this process dies mid-write
+            tmp_path = output_path.with_name(output_path.name + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(output_json)
+                os.replace(tmp_path, output_path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
             print(f"Successfully wrote updated known_good.json to {output_path}")
 
 
@@ -104,22 +138,26 @@ def load_known_good(path: Path) -> KnownGood:
             KnownGood instance with parsed modules
     """
 
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
-        try:
-            data = json.loads(text)
-        except json.JSONDecodeError as e:
-            lines = text.splitlines()
-            line = lines[e.lineno - 1] if 0 <= e.lineno - 1 < len(lines) else ""
-            pointer = " " * (e.colno - 1) + "^"
-
-            hint = ""
-            if "Expecting value" in e.msg:
-                hint = "Possible causes: trailing comma, missing value, or extra comma."
-
-            raise ValueError(
-                f"Invalid JSON at line {e.lineno}, column {e.colno}\n{line}\n{pointer}\n{e.msg}. {hint}"
-            ) from None
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    # Parse with orjson when available (C-accelerated, ~2-5x faster); its
+    # JSONDecodeError subclasses json.JSONDecodeError so one handler covers both
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except json.JSONDecodeError as e:
+        text = raw.decode("utf-8", errors="replace")
+        lines = text.splitlines()
+        line = lines[e.lineno - 1] if 0 <= e.lineno - 1 < len(lines) else ""
+        pointer = " " * (e.colno - 1) + "^"
+
+        hint = ""
+        if "Expecting value" in e.msg:
+            hint = "Possible causes: trailing comma, missing value, or extra comma."
+
+        raise ValueError(
+            f"Invalid JSON at line {e.lineno}, column {e.colno}\n{line}\n{pointer}\n{e.msg}. {hint}"
+        ) from None
 
     if not isinstance(data, dict) or not isinstance(data.get("modules"), dict):
         raise ValueError(f"Invalid known_good.json at {path} (expected object with 'modules' dict)")
@@ -14,27 +14,62 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
-from urllib.parse import urlparse
 
+_GH_PREFIX = "https://github.com/"
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def _owner_repo(repo_url: str) -> str:
+    """Parse 'owner/repo' out of a GitHub HTTPS URL, memoized per URL.
+
+    The accepted format is the narrow https://github.com/<owner>/<repo>[.git]
+    shape, so a prefix check plus one partition replaces urlparse and its
+    ParseResult allocation on this hot path.
+    """
+    if not repo_url.startswith(_GH_PREFIX):
+        raise ValueError(f"Not a GitHub URL: {repo_url}")
+
+    # Strip the fixed prefix and the .git suffix
+    path = repo_url[len(_GH_PREFIX) :].removesuffix(".git")
+
+    # Validate owner/repo format
+    owner, sep, repo = path.partition("/")
+    if not sep or not owner or not repo or "/" in repo:
+        raise ValueError(f"Cannot parse owner/repo from: {repo_url}")
+
+    return f"{owner}/{repo}"
+
+
+# Shared immutable defaults; every Metadata without explicit values references
+# these instead of allocating fresh lists per instance
+_DEFAULT_TEST_CONFIG: tuple[str, ...] = ()
+_DEFAULT_EXCLUDE_TARGETS: tuple[str, ...] = ()
+_DEFAULT_LANGS: tuple[str, ...] = ("cpp", "rust")
+
+
+@dataclass(slots=True, frozen=True)
 class Metadata:
     """Metadata configuration for a module.
 
+    Frozen: metadata is only read after construction, and freezing lets
+    instances share the default tuples safely.
+
     Attributes:
             code_root_path: Root path to the code directory
-            extra_test_config: List of extra test configuration flags
-            exclude_test_targets: List of test targets to exclude
-            langs: List of languages supported (e.g., ["cpp", "rust"])
+            extra_test_config: Extra test configuration flags
+            exclude_test_targets: Test targets to exclude
+            langs: Languages supported (e.g., ("cpp", "rust"))
     """
 
     code_root_path: str = "//score/..."
-    extra_test_config: list[str] = field(default_factory=lambda: [])
-    exclude_test_targets: list[str] = field(default_factory=lambda: [])
-    langs: list[str] = field(default_factory=lambda: ["cpp", "rust"])
+    extra_test_config: tuple[str, ...] = _DEFAULT_TEST_CONFIG
+    exclude_test_targets: tuple[str, ...] = _DEFAULT_EXCLUDE_TARGETS
+    langs: tuple[str, ...] = _DEFAULT_LANGS
     rust_coverage_config: str | None = "ferrocene-coverage"  # Optional field for Rust coverage configuration
 
     @classmethod
@@ -49,9 +84,11 @@ class Metadata:
         """
         return cls(
             code_root_path=data.get("code_root_path", "//score/..."),
-            extra_test_config=data.get("extra_test_config", []),
-            exclude_test_targets=data.get("exclude_test_targets", []),
-            langs=data.get("langs", ["cpp", "rust"]),
+            extra_test_config=tuple(data.get("extra_test_config", _DEFAULT_TEST_CONFIG)),
+            exclude_test_targets=tuple(data.get("exclude_test_targets", _DEFAULT_EXCLUDE_TARGETS)),
+            # langs draws from a tiny fixed vocabulary ("cpp", "rust", ...);
+            # interning dedupes the str objects parsed out of the JSON
+            langs=tuple(map(sys.intern, data.get("langs", _DEFAULT_LANGS))),
             rust_coverage_config=data.get("rust_coverage_config", "ferrocene-coverage"),
         )
 
@@ -63,14 +100,14 @@ class Metadata:
         """
         return {
             "code_root_path": self.code_root_path,
-            "extra_test_config": self.extra_test_config,
-            "exclude_test_targets": self.exclude_test_targets,
-            "langs": self.langs,
+            "extra_test_config": list(self.extra_test_config),
+            "exclude_test_targets": list(self.exclude_test_targets),
+            "langs": list(self.langs),
             "rust_coverage_config": self.rust_coverage_config,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Module:
     name: str
     hash: str
@@ -107,10 +144,13 @@ class Module:
         Returns:
                 Module instance
         """
-        repo = module_data.get("repo", "")
+        # Bind the lookup method once; from_dict does eight dict lookups per module
+        get = module_data.get
+
+        repo = get("repo", "")
         # Support both 'hash' and 'commit' keys
-        commit_hash = module_data.get("hash") or module_data.get("commit", "")
-        version = module_data.get("version")
+        commit_hash = get("hash") or get("commit", "")
+        version = get("version")
 
         if commit_hash and version:
             raise ValueError(
@@ -118,10 +158,10 @@ class Module:
                 "Use either 'hash' (git_override) or 'version' (single_version_override), not both."
             )
         # Support both 'bazel_patches' and legacy 'patches' keys
-        bazel_patches = module_data.get("bazel_patches") or module_data.get("patches", [])
+        bazel_patches = get("bazel_patches") or get("patches", [])
 
         # Parse metadata - if not present or is None/empty dict, use defaults
-        metadata_data = module_data.get("metadata")
+        metadata_data = get("metadata")
         if metadata_data is not None:
             metadata = Metadata.from_dict(metadata_data)
             # Enable once we are able to remove '*' in known_good.json
@@ -134,8 +174,8 @@ class Module:
             # If metadata key is missing, create with defaults
             metadata = Metadata()
 
-        branch = module_data.get("branch", "main")
-        pin_version = module_data.get("pin_version", False)
+        branch = get("branch", "main")
+        pin_version = get("pin_version", False)
 
         return cls(
             name=name,
@@ -176,19 +216,7 @@ class Module:
         """Return owner/repo part extracted from HTTPS GitHub URL."""
         # Examples:
         # https://github.com/eclipse-score/logging.git -> eclipse-score/logging
-        parsed = urlparse(self.repo)
-        if parsed.netloc != "github.com":
-            raise ValueError(f"Not a GitHub URL: {self.repo}")
-
-        # Extract path, remove leading slash and .git suffix
-        path = parsed.path.lstrip("/").removesuffix(".git")
-
-        # Split and validate owner/repo format
-        parts = path.split("/", 2)  # Split max 2 times to get owner and repo
-        if len(parts) != 2:
-            raise ValueError(f"Cannot parse owner/repo from: {self.repo}")
-
-        return f"{parts[0]}/{parts[1]}"
+        return _owner_repo(self.repo)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Module instance to dictionary representation for JSON output.
@@ -26,9 +26,8 @@ update_module_from_known_good.py to generate the MODULE.bazel file.
 """
 
 import argparse
-import os
 import re
-import datetime as dt
+import time
 from pathlib import Path
 from typing import Dict, List
 import logging
@@ -36,8 +35,19 @@ import logging
 from models import Module
 from models.known_good import KnownGood, load_known_good
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+# Compiled once at import; parse_and_apply_overrides runs it per override entry
+_REPO_URL_RE = re.compile(r"^https://[a-zA-Z0-9.-]+/[a-zA-Z0-9._/-]+\.git$")
+
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+
+def _is_hex_hash(value: str) -> bool:
+    """Return True if value is a 7-40 character hex commit hash.
+
+    bytes.translate with a delete table is a single C call, noticeably
+    cheaper than running the regex engine for a fixed alphabet check.
+    """
+    return 7 <= len(value) <= 40 and not value.encode("ascii", "replace").translate(None, _HEX_DIGITS)
 
 
 def parse_and_apply_overrides(modules: Dict[str, Module], repo_overrides: List[str]) -> int:
@@ -55,59 +65,67 @@ def parse_and_apply_overrides(modules: Dict[str, Module], repo_overrides: List[s
     Returns:
         The number of overrides applied.
     """
-    repo_url_pattern = re.compile(r"^https://[a-zA-Z0-9.-]+/[a-zA-Z0-9._/-]+\.git$")
-    hash_pattern = re.compile(r"^[a-fA-F0-9]{7,40}$")
     overrides_applied = 0
 
-    # Parse and validate overrides
+    # Parse and validate overrides; a find-based scan instead of str.split
+    # avoids building a throwaway list per entry
     for entry in repo_overrides:
-        logging.info(f"Override registered: {entry}")
-        parts = entry.split("@")
+        logging.info("Override registered: %s", entry)
+        first = entry.find("@")
+        second = entry.find("@", first + 1) if first != -1 else -1
 
-        if len(parts) == 2:
+        if first != -1 and second == -1:
             # module_name@hash
-            module_name, commit_hash = parts
+            module_name, commit_hash = entry[:first], entry[first + 1 :]
 
-            if not hash_pattern.match(commit_hash):
+            if not _is_hex_hash(commit_hash):
                 raise SystemExit(f"Invalid commit hash in '{entry}': {commit_hash}\nExpected 7-40 hex characters")
 
-            # Validate module exists
+            # Validate module exists; only build the sorted module listing
+            # when the warning will actually be emitted
             if module_name not in modules:
-                logging.warning(
-                    f"Module '{module_name}' not found in known_good.json\n"
-                    f"Available modules: {', '.join(sorted(modules.keys()))}"
-                )
+                if logging.getLogger().isEnabledFor(logging.WARNING):
+                    logging.warning(
+                        "Module '%s' not found in known_good.json\nAvailable modules: %s",
+                        module_name,
+                        ", ".join(sorted(modules)),
+                    )
                 continue
 
             module = modules[module_name]
             old_value = module.version or module.hash
 
             if commit_hash == module.hash:
-                logging.info(f"Module '{module_name}' already at specified commit {commit_hash}, no change needed")
+                logging.info("Module '%s' already at specified commit %s, no change needed", module_name, commit_hash)
             else:
                 module.hash = commit_hash
                 module.version = None  # Clear version when overriding hash
-                logging.info(f"Applied override to {module_name}: {old_value} -> {commit_hash}")
+                logging.info("Applied override to %s: %s -> %s", module_name, old_value, commit_hash)
                 overrides_applied += 1
 
-        elif len(parts) == 3:
+        elif second != -1 and entry.find("@", second + 1) == -1:
             # Format: module_name@repo_url@hash
-            module_name, repo_url, commit_hash = parts
+            module_name = entry[:first]
+            repo_url = entry[first + 1 : second]
+            commit_hash = entry[second + 1 :]
 
-            if not hash_pattern.match(commit_hash):
+            if not _is_hex_hash(commit_hash):
                 raise SystemExit(f"Invalid commit hash in '{entry}': {commit_hash}\nExpected 7-40 hex characters")
 
-            if not repo_url_pattern.match(repo_url):
+            if not _REPO_URL_RE.match(repo_url):
                 raise SystemExit(
                     f"Invalid repo URL in '{entry}': {repo_url}\nExpected format: https://github.com/org/repo.git"
                 )
 
-            # Validate module exists
+            # Validate module exists; only build the sorted module listing
+            # when the warning will actually be emitted
             if module_name not in modules:
-                logging.warning(
-                    f"Module '{module_name}' not found in known_good.json\n"
-                    f"Available modules: {', '.join(sorted(modules.keys()))}"
-                )
+                if logging.getLogger().isEnabledFor(logging.WARNING):
+                    logging.warning(
+                        "Module '%s' not found in known_good.json\nAvailable modules: %s",
+                        module_name,
+                        ", ".join(sorted(modules)),
+                    )
                 continue
 
             module = modules[module_name]
@@ -118,7 +136,7 @@ def parse_and_apply_overrides(modules: Dict[str, Module], repo_overrides: List[s
                 module.version = None  # Clear version when overriding hash
 
             module.repo = repo_url
-            logging.info(f"Applied override to {module_name}: {old_value} -> {commit_hash} (repo: {repo_url})")
+            logging.info("Applied override to %s: %s -> %s (repo: %s)", module_name, old_value, commit_hash, repo_url)
             overrides_applied += 1
 
         else:
@@ -142,16 +160,20 @@ def apply_overrides(known_good: KnownGood, repo_overrides: List[str]) -> KnownGo
     Returns:
         Updated KnownGood instance
     """
-    # Parse and apply overrides
-    overrides_applied = parse_and_apply_overrides(known_good.modules, repo_overrides)
+    # known_good.modules is nested {group: {name: Module}}; flatten to the
+    # name -> Module mapping parse_and_apply_overrides works on. The Module
+    # objects are shared, so applied overrides land in the nested dict too.
+    flat_modules = {m.name: m for m in known_good.all_modules()}
+    overrides_applied = parse_and_apply_overrides(flat_modules, repo_overrides)
 
     if overrides_applied == 0:
         logging.warning("No overrides were applied to any modules")
     else:
-        logging.info(f"Successfully applied {overrides_applied} override(s)")
+        logging.info("Successfully applied %d override(s)", overrides_applied)
 
-    # Update timestamp
-    known_good.timestamp = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat() + "Z"
+    # Update timestamp; strftime over gmtime gives the UTC second-resolution
+    # stamp in one C call with no intermediate datetime objects
+    known_good.timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     return known_good
 
@@ -206,19 +228,21 @@ Examples:
 
     args = parser.parse_args()
 
+    # Configure logging on first use instead of at import time
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    known_path = os.path.abspath(args.known)
-    output_path = os.path.abspath(args.output)
+    known_path = Path(args.known).resolve()
+    output_path = Path(args.output).resolve()
 
     # Load, update, and output
-    logging.info(f"Loading {known_path}")
+    logging.info("Loading %s", known_path)
     try:
         known_good = load_known_good(known_path)
-    except FileNotFoundError as e:
-        raise SystemExit(f"ERROR: {e}")
-    except ValueError as e:
+    except (FileNotFoundError, ValueError) as e:
         raise SystemExit(f"ERROR: {e}")
 
     if not args.module_overrides:
@@ -227,7 +251,7 @@ Examples:
     overrides = args.module_overrides
 
     updated_known_good = apply_overrides(known_good, overrides)
-    updated_known_good.write(Path(output_path), args.dry_run)
+    updated_known_good.write(output_path, args.dry_run)
 
 
 if __name__ == "__main__":
@@ -29,160 +29,273 @@ use scripts/known_good/override_known_good_repo.py first to create an updated kn
 """
 
 import argparse
+import hashlib
+import json
 import logging
-import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from models import Module
 from models.known_good import load_known_good
 
-# Configure logging
-logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+# Compiled once at import instead of per override entry
+_REPO_OVERRIDE_RE = re.compile(r"https://[a-zA-Z0-9.-]+/[a-zA-Z0-9._/-]+\.git@[a-fA-F0-9]{7,40}$")
+
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+# Block templates bound once at import; CPython caches the parsed format spec,
+# so rendering a block is one format_map call instead of chained f-strings
+_VERSION_BLOCK_TMPL = (
+    'bazel_dep(name = "{name}")\n'
+    "single_version_override(\n"
+    '    module_name = "{name}",\n'
+    "{patch_strip}"
+    "{patches}"
+    '    version = "{version}",\n'
+    ")\n"
+)
+
+_GIT_BLOCK_TMPL = (
+    'bazel_dep(name = "{name}")\n'
+    "git_override(\n"
+    '    module_name = "{name}",\n'
+    '    commit = "{commit}",\n'
+    "{patch_strip}"
+    "{patches}"
+    '    remote = "{repo}",\n'
+    ")\n"
+)
+
+_LOCAL_BLOCK_TMPL = (
+    'bazel_dep(name = "{name}")\n'
+    "local_path_override(\n"
+    '    module_name = "{name}",\n'
+    '    path = "{name}",\n'
+    ")\n"
+)
+
+# Persistent cache of rendered git_override blocks keyed by module content
+# hash; in CI most modules are unchanged between runs
+_BLOCK_CACHE_PATH = Path(".known_good_block_cache.json")
+
+
+def _load_block_cache() -> Dict[str, str]:
+    """Load the rendered-block cache, returning an empty dict on any problem."""
+    try:
+        with open(_BLOCK_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {}
 
 
-def generate_git_override_blocks(modules: List[Module], repo_commit_dict: Dict[str, str]) -> List[str]:
-    """Generate bazel_dep and git_override blocks for each module."""
-    blocks = []
+def _store_block_cache(cache: Dict[str, str]) -> None:
+    """Persist the rendered-block cache; best effort, failures are ignored."""
+    try:
+        with open(_BLOCK_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
-    for module in modules:
-        commit = module.hash
-
-        # Allow overriding specific repos via command line
-        if module.repo in repo_commit_dict:
-            commit = repo_commit_dict[module.repo]
-
-        # Generate patches lines if bazel_patches exist
-        patches_lines = ""
-        if module.bazel_patches:
-            patches_lines = "    patches = [\n"
-            for patch in module.bazel_patches:
-                patches_lines += f'        "{patch}",\n'
-            patches_lines += "    ],\n"
-        patch_strip_line = "    patch_strip = 1,\n" if patches_lines else ""
-
-        if module.version:
-            # If version is provided, use bazel_dep with single_version_override
-            block = (
-                f'bazel_dep(name = "{module.name}")\n'
-                "single_version_override(\n"
-                f'    module_name = "{module.name}",\n'
-                f"{patch_strip_line}"
-                f"{patches_lines}"
-                f'    version = "{module.version}",\n'
-                ")\n"
-            )
-        else:
-            if not module.repo or not commit:
-                logging.warning(
-                    "Skipping module %s with missing repo or commit: repo=%s, commit=%s",
-                    module.name,
-                    module.repo,
-                    commit,
-                )
-                continue
-
-            # Validate commit hash format (7-40 hex characters)
-            if not re.match(r"^[a-fA-F0-9]{7,40}$", commit):
-                logging.warning(
-                    "Skipping module %s with invalid commit hash: %s",
-                    module.name,
-                    commit,
-                )
-                continue
 
-            # If no version, use bazel_dep with git_override
-            # Only include patch_strip if there are patches to apply
-            block = (
-                f'bazel_dep(name = "{module.name}")\n'
-                "git_override(\n"
-                f'    module_name = "{module.name}",\n'
-                f'    commit = "{commit}",\n'
-                f"{patch_strip_line}"
-                f"{patches_lines}"
-                f'    remote = "{module.repo}",\n'
-                ")\n"
-            )
-        blocks.append(block)
+def _block_cache_key(module: Module, commit: str) -> str:
+    """Content hash of a module (plus the effective commit) for the block cache."""
+    payload = json.dumps(module.to_dict(), sort_keys=True).encode() + commit.encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-    return blocks
 
+_COVERAGE_TMPL = """
+rust_coverage_report(
+    name = "rust_coverage_{name}",
+    bazel_configs = [
+        "linux-x86_64",
+        "{config}",
+    ],
+    query = 'kind("rust_test", @{name}{code_root_path}){excluded}',
+    visibility = ["//visibility:public"],
+)"""
 
-def generate_local_override_blocks(modules: List[Module]) -> List[str]:
-    """Generate bazel_dep and local_path_override blocks for each module."""
-    blocks = []
 
-    for module in modules:
-        block = (
-            f'bazel_dep(name = "{module.name}")\n'
-            "local_path_override(\n"
-            f'    module_name = "{module.name}",\n'
-            f'    path = "{module.name}",\n'
-            ")\n"
-        )
+def _is_hex_hash(value: str) -> bool:
+    """Return True if value is a 7-40 character hex commit hash.
 
-        blocks.append(block)
+    bytes.translate with a delete table is a single C call, noticeably
+    cheaper than running the regex engine for a fixed alphabet check.
+    """
+    return 7 <= len(value) <= 40 and not value.encode("ascii", "replace").translate(None, _HEX_DIGITS)
 
-    return blocks
 
+def _git_override_block(
+    module: Module, repo_commit_dict: Dict[str, str], block_cache: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    """Generate the bazel_dep and git_override block for one module.
 
-def generate_coverage_blocks(modules: List[Module]) -> List[str]:
-    """Generate rust_coverage_report  blocks for each module with rust impl."""
-    blocks = ["""load("@score_tooling//:defs.bzl", "rust_coverage_report")"""]
+    Returns None (and warns) for modules that cannot be rendered. When a
+    block_cache is given, unchanged modules reuse their previously rendered
+    block instead of re-formatting it.
+    """
+    commit = module.hash
 
-    for module in modules:
-        if "rust" not in module.metadata.langs:
-            continue
+    # Allow overriding specific repos via command line
+    if module.repo in repo_commit_dict:
+        commit = repo_commit_dict[module.repo]
 
-        if module.metadata.exclude_test_targets:
-            excluded_tests = (
-                f" {' '.join([f'-@{module.name}{target}' for target in module.metadata.exclude_test_targets])}"
-            )
-        else:
-            excluded_tests = ""
+    cache_key = None
+    if block_cache is not None:
+        cache_key = _block_cache_key(module, commit)
+        cached = block_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Generate patches lines if bazel_patches exist; single join instead of
+    # growing the string per patch
+    patches_lines = ""
+    if module.bazel_patches:
+        patches_lines = "".join(
+            ("    patches = [\n", *(f'        "{patch}",\n' for patch in module.bazel_patches), "    ],\n")
+        )
+    patch_strip_line = "    patch_strip = 1,\n" if patches_lines else ""
+
+    if module.version:
+        # If version is provided, use bazel_dep with single_version_override
+        block = _VERSION_BLOCK_TMPL.format_map(
+            {
+                "name": module.name,
+                "patch_strip": patch_strip_line,
+                "patches": patches_lines,
+                "version": module.version,
+            }
+        )
+        if cache_key is not None:
+            block_cache[cache_key] = block
+        return block
+
+    if not module.repo or not commit:
+        logging.warning(
+            "Skipping module %s with missing repo or commit: repo=%s, commit=%s",
+            module.name,
+            module.repo,
+            commit,
+        )
+        return None
+
+    # Validate commit hash format (7-40 hex characters)
+    if not _is_hex_hash(commit):
+        logging.warning(
+            "Skipping module %s with invalid commit hash: %s",
+            module.name,
+            commit,
+        )
+        return None
+
+    # If no version, use bazel_dep with git_override
+    # Only include patch_strip if there are patches to apply
+    block = _GIT_BLOCK_TMPL.format_map(
+        {
+            "name": module.name,
+            "commit": commit,
+            "patch_strip": patch_strip_line,
+            "patches": patches_lines,
+            "repo": module.repo,
+        }
+    )
+    if cache_key is not None:
+        block_cache[cache_key] = block
+    return block
 
-        ferrocene_config = module.metadata.rust_coverage_config or "ferrocene-coverage"
-        block = f"""
-rust_coverage_report(
-    name = "rust_coverage_{module.name}",
-    bazel_configs = [
-        "linux-x86_64",
-        "{ferrocene_config}",
-    ],
-    query = 'kind("rust_test", @{module.name}{module.metadata.code_root_path}){excluded_tests}',
-    visibility = ["//visibility:public"],
-)"""
 
-        blocks.append(block)
-    blocks.append("")  # Add final newline
-    return blocks
+def _local_override_block(module: Module) -> str:
+    """Generate the bazel_dep and local_path_override block for one module."""
+    return _LOCAL_BLOCK_TMPL.format_map({"name": module.name})
 
 
-def generate_file_content(
+def _coverage_block(module: Module) -> Optional[str]:
+    """Generate the rust_coverage_report block for one module, None without rust impl."""
+    metadata = module.metadata
+    if "rust" not in metadata.langs:
+        return None
+
+    excluded_tests = "".join(f" -@{module.name}{target}" for target in metadata.exclude_test_targets)
+
+    return _COVERAGE_TMPL.format_map(
+        {
+            "name": module.name,
+            "config": metadata.rust_coverage_config or "ferrocene-coverage",
+            "code_root_path": metadata.code_root_path,
+            "excluded": excluded_tests,
+        }
+    )
+
+
+def render_group(
     args: argparse.Namespace,
-    modules: List[Module],
+    modules: Iterable[Module],
     repo_commit_dict: Dict[str, str],
+    block_cache: Optional[Dict[str, str]] = None,
+) -> tuple[List[str], List[str]]:
+    """Render override blocks and coverage blocks in a single pass over modules.
+
+    Returns:
+        Tuple of (module override blocks, coverage BUILD blocks)
+    """
+    use_git = args.override_type == "git"
+    module_blocks: List[str] = []
+    coverage_blocks: List[str] = ["""load("@score_tooling//:defs.bzl", "rust_coverage_report")"""]
+
+    for module in modules:
+        if use_git:
+            block = _git_override_block(module, repo_commit_dict, block_cache)
+            if block is not None:
+                module_blocks.append(block)
+        else:
+            module_blocks.append(_local_override_block(module))
+
+        coverage = _coverage_block(module)
+        if coverage is not None:
+            coverage_blocks.append(coverage)
+
+    coverage_blocks.append("")  # Add final newline
+    return module_blocks, coverage_blocks
+
+
+# License header for generated files, built once at import
+_LICENSE_HEADER = (
+    "# *******************************************************************************\n"
+    "# Copyright (c) 2025 Contributors to the Eclipse Foundation\n"
+    "#\n"
+    "# See the NOTICE file(s) distributed with this work for additional\n"
+    "# information regarding copyright ownership.\n"
+    "#\n"
+    "# This program and the accompanying materials are made available under the\n"
+    "# terms of the Apache License Version 2.0 which is available at\n"
+    "# https://www.apache.org/licenses/LICENSE-2.0\n"
+    "#\n"
+    "# SPDX-License-Identifier: Apache-2.0\n"
+    "# *******************************************************************************\n"
+    "\n"
+)
+
+_LOCAL_NOTE = "# Note: This file uses local_path overrides. Ensure that local paths are set up correctly.\n\n"
+
+
+def write_file(
+    fh,
+    args: argparse.Namespace,
+    blocks: List[str],
     timestamp: Optional[str] = None,
     file_type: str = "module",
-) -> str:
-    """Generate the complete content for score_modules.MODULE.bazel."""
-    # License header
-    header = (
-        "# *******************************************************************************\n"
-        "# Copyright (c) 2025 Contributors to the Eclipse Foundation\n"
-        "#\n"
-        "# See the NOTICE file(s) distributed with this work for additional\n"
-        "# information regarding copyright ownership.\n"
-        "#\n"
-        "# This program and the accompanying materials are made available under the\n"
-        "# terms of the Apache License Version 2.0 which is available at\n"
-        "# https://www.apache.org/licenses/LICENSE-2.0\n"
-        "#\n"
-        "# SPDX-License-Identifier: Apache-2.0\n"
-        "# *******************************************************************************\n"
-        "\n"
-    )
+) -> None:
+    """Stream the complete content for score_modules.MODULE.bazel to a file handle.
+
+    Writing header and blocks individually avoids building the whole file as
+    one string in memory first.
+    """
+    header = _LICENSE_HEADER
 
     if timestamp:
         header += (
@@ -190,21 +303,17 @@ def generate_file_content(
             "# Do not edit manually - use scripts/known_good/update_module_from_known_good.py\n"
             "\n"
         )
-    if file_type == "module":
-        if args.override_type == "git":
-            blocks = generate_git_override_blocks(modules, repo_commit_dict)
-        else:
-            header += "# Note: This file uses local_path overrides. Ensure that local paths are set up correctly.\n\n"
-            blocks = generate_local_override_blocks(modules)
-    elif file_type == "build":
-        blocks = generate_coverage_blocks(modules)
-    else:
-        raise ValueError(f"Invalid file_type: {file_type}")
+    if file_type == "module" and args.override_type != "git":
+        header += _LOCAL_NOTE
 
     if not blocks:
         raise SystemExit("No valid modules to generate git_override blocks")
 
-    return header + "\n".join(blocks)
+    fh.write(header)
+    for i, block in enumerate(blocks):
+        if i:
+            fh.write("\n")
+        fh.write(block)
 
 
 def main() -> None:
@@ -267,20 +376,24 @@ Note:
 
     args = parser.parse_args()
 
+    # Configure logging on first use instead of at import time
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
     if args.verbose:
         logging.getLogger().setLevel(logging.INFO)
 
-    known_path = os.path.abspath(args.known)
-
-    if not os.path.exists(known_path):
-        raise SystemExit(f"known_good.json not found at {known_path}")
+    # resolve(strict=True) canonicalizes and checks existence in one go
+    try:
+        known_path = Path(args.known).resolve(strict=True)
+    except FileNotFoundError:
+        raise SystemExit(f"known_good.json not found at {Path(args.known).resolve()}")
 
     # Parse repo overrides
     repo_commit_dict = {}
     if args.repo_override:
-        repo_pattern = re.compile(r"https://[a-zA-Z0-9.-]+/[a-zA-Z0-9._/-]+\.git@[a-fA-F0-9]{7,40}$")
         for entry in args.repo_override:
-            if not repo_pattern.match(entry):
+            if not _REPO_OVERRIDE_RE.match(entry):
                 raise SystemExit(
                     f"Invalid --repo-override format: {entry}\n"
                     "Expected format: https://github.com/org/repo.git@<commit_sha>"
@@ -290,70 +403,97 @@ Note:
 
     # Load known_good.json
     try:
-        known_good = load_known_good(Path(known_path))
-    except FileNotFoundError as e:
-        raise SystemExit(f"ERROR: {e}")
-    except ValueError as e:
+        known_good = load_known_good(known_path)
+    except (FileNotFoundError, ValueError) as e:
         raise SystemExit(f"ERROR: {e}")
 
     if not known_good.modules:
         raise SystemExit("No modules found in known_good.json")
 
     # Generate files based on structure (flat vs grouped)
-    output_dir_modules = os.path.abspath(args.output_dir_modules)
-    os.makedirs(output_dir_modules, exist_ok=True)
+    output_dir_modules = Path(args.output_dir_modules).resolve()
+    output_dir_modules.mkdir(parents=True, exist_ok=True)
+    output_dir_coverage = Path(args.output_dir_coverage).resolve()
+    output_dir_coverage.mkdir(parents=True, exist_ok=True)
 
-    generated_files = []
+    generated_files: List[Path] = []
     total_module_count = 0
+    block_cache = _load_block_cache()
 
-    for group_name, group_modules in known_good.modules.items():
-        modules = list(group_modules.values())
+    def _process_group(group_name: str, group_modules: Dict[str, Module]) -> tuple[List[Path], int]:
+        """Generate the MODULE (and coverage BUILD) file for one group.
 
-        if not modules:
-            logging.warning(f"Skipping empty group: {group_name}")
-            continue
+        Returns:
+            Tuple of (generated file paths, module count)
+        """
+        # dict values view is sized and iterable; no need to copy into a list
+        modules = group_modules.values()
+        module_count = len(group_modules)
 
         # Determine output filename: score_modules_{group}.MODULE.bazel
         output_filename = f"score_modules_{group_name}.MODULE.bazel"
 
-        output_path_modules = os.path.join(output_dir_modules, output_filename)
-        output_path_coverage = args.output_dir_coverage / "BUILD"
+        output_path_modules = output_dir_modules / output_filename
+        output_path_coverage = output_dir_coverage / "BUILD"
 
-        # Generate file content of MODULE files
-        content_module = generate_file_content(
-            args, modules, repo_commit_dict, known_good.timestamp, file_type="module"
-        )
+        # Render override and coverage blocks in one pass over the group
+        module_blocks, coverage_blocks = render_group(args, modules, repo_commit_dict, block_cache)
+
+        generated: List[Path] = []
 
+        # Stream content of MODULE files
         if args.dry_run:
             print(f"\nDry run: would write to {output_path_modules}\n")
             print("---- BEGIN GENERATED CONTENT FOR MODULE ----")
-            print(content_module)
+            write_file(sys.stdout, args, module_blocks, known_good.timestamp, file_type="module")
+            print()
             print("---- END GENERATED CONTENT FOR MODULE ----")
-            print(f"\nGenerated {len(modules)} {args.override_type}_override entries for group '{group_name}'")
+            print(f"\nGenerated {module_count} {args.override_type}_override entries for group '{group_name}'")
         else:
-            with open(output_path_modules, "w", encoding="utf-8") as f:
-                f.write(content_module)
-            generated_files.append(output_path_modules)
-            total_module_count += len(modules)
-            print(f"Generated {output_path_modules} with {len(modules)} {args.override_type}_override entries")
-
-        # Generate file content of BUILD coverage files
-        if "target_sw" not in group_name:
-            continue  # Only generate coverage for software modules
-
-        content_build = generate_file_content(args, modules, repo_commit_dict, known_good.timestamp, file_type="build")
+            with open(output_path_modules, "w", encoding="utf-8", buffering=1 << 20) as f:
+                write_file(f, args, module_blocks, known_good.timestamp, file_type="module")
+            generated.append(output_path_modules)
+            print(f"Generated {output_path_modules} with {module_count} {args.override_type}_override entries")
+
+        # Generate file content of BUILD coverage files for software modules only
+        if "target_sw" in group_name:
+            if args.dry_run:
+                print(f"\nDry run: would write to {output_path_coverage}\n")
+                print("---- BEGIN GENERATED CONTENT FOR BUILD ----")
+                write_file(sys.stdout, args, coverage_blocks, known_good.timestamp, file_type="build")
+                print()
+                print("---- END GENERATED CONTENT FOR BUILD ----")
+                print(f"\nGenerated {module_count} {args.override_type}_override entries for group '{group_name}'")
+            else:
+                with open(output_path_coverage, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    write_file(f, args, coverage_blocks, known_good.timestamp, file_type="build")
+                generated.append(output_path_coverage)
+                print(f"Generated {output_path_coverage}")
+
+        return generated, module_count
+
+    groups = []
+    for group_name, group_modules in known_good.modules.items():
+        if not group_modules:
+            logging.warning("Skipping empty group: %s", group_name)
+            continue
+        groups.append((group_name, group_modules))
 
-        if args.dry_run:
-            print(f"\nDry run: would write to {output_path_coverage}\n")
-            print("---- BEGIN GENERATED CONTENT FOR BUILD ----")
-            print(content_build)
-            print("---- END GENERATED CONTENT FOR BUILD ----")
-            print(f"\nGenerated {len(modules)} {args.override_type}_override entries for group '{group_name}'")
-        else:
-            with open(output_path_coverage, "w", encoding="utf-8") as f:
-                f.write(content_build)
-            generated_files.append(output_path_coverage)
-            print(f"Generated {output_path_coverage}")
+    if args.dry_run:
+        # Serial to keep the printed previews in group order
+        for group_name, group_modules in groups:
+            _process_group(group_name, group_modules)
+    else:
+        # Groups are independent (one MODULE file each, coverage only for
+        # target_sw), so generation and the file writes can overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(groups) or 1)) as executor:
+            futures = [executor.submit(_process_group, name, mods) for name, mods in groups]
+            for future in futures:
+                group_generated, module_count = future.result()
+                generated_files.extend(group_generated)
+                total_module_count += module_count
+
+        _store_block_cache(block_cache)
 
     if not args.dry_run and generated_files:
         print(f"\nSuccessfully generated {len(generated_files)} file(s) with {total_module_count} total modules")
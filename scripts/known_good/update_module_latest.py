@@ -37,29 +37,277 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib.util
 import shutil
 import subprocess
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from models.known_good import load_known_good
 
-try:
-    from github import Github, GithubException
+# Bounded so parallel lookups stay well under GitHub's secondary rate limits
+# (and, on the gh path, bound the number of live subprocesses)
+_MAX_FETCH_WORKERS = 10
+
+# GraphQL aliases per POST; GitHub rejects queries touching too many nodes
+_GRAPHQL_BATCH_SIZE = 100
+
+# Attempts per REST lookup when GitHub answers 403/429 with Retry-After
+_MAX_RETRY_ATTEMPTS = 5
+
+# ETag cache, stored next to known_good.json:
+# {"<owner>/<repo>@<branch>": {"etag": "...", "sha": "...", "checked_at": <epoch>}}
+_SHA_CACHE_NAME = ".update_module_latest_cache.json"
+
+# How long a cached sha that matches the stored hash is trusted without
+# re-querying GitHub at all
+_SHA_CACHE_TTL_SECONDS = 300
+
 
-    HAS_PYGITHUB = True
+def _load_sha_cache(path: Path) -> dict:
+    """Load the ETag/sha cache, returning an empty dict on any problem."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {}
+
+
+def _store_sha_cache(path: Path, cache: dict) -> None:
+    """Persist the ETag/sha cache; best effort, failures are ignored."""
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
 except ImportError:
-    HAS_PYGITHUB = False
-    Github = None
-    GithubException = None
+    requests = None
+    HTTPAdapter = None
+    Retry = None
+
+
+class _RateLimitGate:
+    """Tracks GitHub's X-RateLimit headers and pauses callers near quota.
+
+    Every response updates the remaining/reset counters; before issuing a
+    request, workers wait until the reset time once fewer requests remain
+    than the fetch pool could issue at once. That way the script throttles
+    itself instead of racing into 403/429 responses and retrying.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._remaining: int | None = None
+        self._reset = 0.0
+
+    def wait(self) -> None:
+        """Block until the quota resets if it is about to run out."""
+        with self._lock:
+            if self._remaining is None or self._remaining >= _MAX_FETCH_WORKERS:
+                return
+            delay = self._reset - time.time()
+        if delay > 0:
+            print(f"INFO: GitHub rate limit nearly exhausted; sleeping {delay:.0f}s", file=sys.stderr)
+            time.sleep(delay)
+
+    def update(self, headers) -> None:
+        """Record the rate-limit state reported by a response."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+            reset = float(headers.get("X-RateLimit-Reset", 0))
+        except ValueError:
+            return
+        with self._lock:
+            self._remaining = remaining
+            self._reset = reset
+
+
+# Shared by the REST and GraphQL paths; both report into the same quota
+_RATE_LIMIT_GATE = _RateLimitGate()
+
+
+def build_session(token: str | None) -> "requests.Session":
+    """Build a pooled requests.Session for the GitHub REST API.
+
+    One session shares a keep-alive connection pool across all module
+    lookups, so only the first request pays the TCP+TLS handshake; the
+    mounted adapter retries transient gateway errors with backoff. Without
+    a token the session runs unauthenticated.
+    """
+    session = requests.Session()
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    session.headers["Accept"] = "application/vnd.github+json"
+    adapter = HTTPAdapter(
+        pool_connections=_MAX_FETCH_WORKERS,
+        pool_maxsize=_MAX_FETCH_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _graphql_ref_query(pairs: list[tuple[str, str]]) -> str:
+    """Build the aliased repository/ref query for a chunk of (owner_repo, branch) pairs."""
+    parts = []
+    for i, (owner_repo, branch) in enumerate(pairs):
+        owner, _, name = owner_repo.partition("/")
+        parts.append(
+            f'r{i}: repository(owner: "{owner}", name: "{name}") '
+            f'{{ ref(qualifiedName: "refs/heads/{branch}") {{ target {{ oid }} }} }}'
+        )
+    return "{ " + " ".join(parts) + " }"
+
+
+def _collect_graphql_oids(data: dict, pairs: list[tuple[str, str]], result: dict) -> None:
+    """Map the aliased oids in a GraphQL response back onto their pairs."""
+    for i, pair in enumerate(pairs):
+        repo_node = data.get(f"r{i}")
+        ref = repo_node.get("ref") if repo_node else None
+        if ref and ref.get("target"):
+            result[pair] = ref["target"]["oid"]
+
+
+def fetch_latest_commits_graphql(
+    session: "requests.Session", pairs: list[tuple[str, str]]
+) -> dict[tuple[str, str], str]:
+    """Fetch branch-head shas for many (owner_repo, branch) pairs in one GraphQL POST.
+
+    Aliases one repository(...){ref(...){target{oid}}} selection per pair, so N
+    REST round-trips collapse into one request per 100 pairs (GitHub limits
+    GraphQL node counts, so larger lists are chunked). Pairs whose repo or
+    branch is missing are left out of the result; callers fall back to the
+    per-repo path for those. Raises RuntimeError if a query itself fails.
+    """
+    result = {}
+    for start in range(0, len(pairs), _GRAPHQL_BATCH_SIZE):
+        chunk = pairs[start : start + _GRAPHQL_BATCH_SIZE]
+        query = _graphql_ref_query(chunk)
+
+        _RATE_LIMIT_GATE.wait()
+        try:
+            resp = session.post("https://api.github.com/graphql", json={"query": query}, timeout=30)
+            _RATE_LIMIT_GATE.update(resp.headers)
+            resp.raise_for_status()
+            payload = resp.json()
+        except (requests.RequestException, ValueError) as e:
+            raise RuntimeError(f"GitHub GraphQL error: {e}") from e
+        data = payload.get("data")
+        if not data:
+            raise RuntimeError(f"GitHub GraphQL error: {payload.get('errors')}")
+
+        _collect_graphql_oids(data, chunk, result)
+    return result
+
+
+def fetch_latest_commits_gh_graphql(pairs: list[tuple[str, str]], gh_path: str = "gh") -> dict[tuple[str, str], str]:
+    """Like fetch_latest_commits_graphql, but batched through one gh subprocess.
+
+    A single 'gh api graphql' call per 100 pairs replaces one gh spawn per
+    module, which removes the fork+exec and auth overhead that dominates
+    each lookup. Raises RuntimeError if a call fails.
+    """
+    result = {}
+    for start in range(0, len(pairs), _GRAPHQL_BATCH_SIZE):
+        chunk = pairs[start : start + _GRAPHQL_BATCH_SIZE]
+        query = _graphql_ref_query(chunk)
+        try:
+            res = subprocess.run(
+                [gh_path, "api", "graphql", "-f", f"query={query}"],
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            payload = json.loads(res.stdout)
+        except (OSError, subprocess.SubprocessError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"gh graphql failed: {e}") from e
+        data = payload.get("data")
+        if not data:
+            raise RuntimeError(f"gh graphql failed: {payload.get('errors')}")
+
+        _collect_graphql_oids(data, chunk, result)
+    return result
+
+
+def fetch_latest_commit_http(
+    session: "requests.Session", owner_repo: str, branch: str, sha_cache: dict | None = None
+) -> str:
+    """Fetch latest commit sha for given owner_repo & branch over plain HTTPS.
+
+    When sha_cache is given, sends the cached ETag as If-None-Match; a 304
+    answer reuses the cached sha without counting against the rate limit,
+    a 200 answer refreshes the cache entry.
+
+    Raises RuntimeError on failure.
+    """
+    key = f"{owner_repo}@{branch}"
+    cached = sha_cache.get(key) if sha_cache is not None else None
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else None
+    try:
+        for attempt in range(_MAX_RETRY_ATTEMPTS):
+            _RATE_LIMIT_GATE.wait()
+            resp = session.get(
+                f"https://api.github.com/repos/{owner_repo}/branches/{branch}", headers=headers, timeout=30
+            )
+            _RATE_LIMIT_GATE.update(resp.headers)
+            # Secondary rate limits answer 403/429 with Retry-After; back off
+            # and retry instead of failing the module outright
+            if resp.status_code in (403, 429) and attempt < _MAX_RETRY_ATTEMPTS - 1:
+                time.sleep(int(resp.headers.get("Retry-After", 2)) * (attempt + 1))
+                continue
+            break
+        if resp.status_code == 304 and cached and cached.get("sha"):
+            cached["checked_at"] = time.time()
+            return cached["sha"]
+        resp.raise_for_status()
+        sha = resp.json()["commit"]["sha"]
+    except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+        raise RuntimeError(f"GitHub API error for {owner_repo}:{branch} - {e}") from e
+    if not sha:
+        raise RuntimeError(f"Empty sha returned for {owner_repo}:{branch}")
+    if sha_cache is not None and resp.headers.get("ETag"):
+        sha_cache[key] = {"etag": resp.headers["ETag"], "sha": sha, "checked_at": time.time()}
+    return sha
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_session() -> "requests.Session":
+    """Shared keep-alive session for the tokenless REST fallback."""
+    return build_session(None)
 
 
 def fetch_latest_commit(owner_repo: str, branch: str, token: str | None) -> str:
-    """Fetch latest commit sha for given owner_repo & branch using PyGithub."""
-    if not HAS_PYGITHUB:
-        raise RuntimeError("PyGithub not installed. Install it with: pip install PyGithub")
+    """Fetch latest commit sha for given owner_repo & branch.
+
+    One REST call to the branches endpoint when requests is available (half
+    the round-trips of the former PyGithub get_repo + get_branch pair);
+    PyGithub is kept only as the last resort when requests is missing.
+    """
+    if requests is not None:
+        return fetch_latest_commit_http(_fallback_session(), owner_repo, branch)
+    # Imported lazily: PyGithub pulls in dozens of submodules, and the gh and
+    # requests paths never need it
+    try:
+        from github import Github, GithubException
+    except ImportError:
+        raise RuntimeError("PyGithub not installed. Install it with: pip install PyGithub") from None
     try:
         gh = Github(token) if token else Github()
         repo = gh.get_repo(owner_repo)
@@ -73,16 +321,19 @@ def fetch_latest_commit(owner_repo: str, branch: str, token: str | None) -> str:
         raise RuntimeError(f"Error fetching {owner_repo}:{branch} - {e}") from e
 
 
-def fetch_latest_commit_gh(owner_repo: str, branch: str) -> str:
+def fetch_latest_commit_gh(owner_repo: str, branch: str, gh_path: str | None = None) -> str:
     """Fetch latest commit using GitHub CLI 'gh' if installed.
 
     Uses: gh api repos/{owner_repo}/branches/{branch} --jq .commit.sha
+    Callers that already resolved the gh executable pass it as gh_path so
+    neither this function nor the child re-scans PATH.
     Raises RuntimeError on failure.
     """
-    if not shutil.which("gh"):
+    gh_path = gh_path or shutil.which("gh")
+    if not gh_path:
         raise RuntimeError("'gh' CLI not found in PATH")
     cmd = [
-        "gh",
+        gh_path,
         "api",
         f"repos/{owner_repo}/branches/{branch}",
         "--jq",
@@ -98,6 +349,25 @@ def fetch_latest_commit_gh(owner_repo: str, branch: str) -> str:
     return sha
 
 
+def probe_ls_remote(repo: str, branch: str) -> str | None:
+    """Return the branch head sha via git ls-remote, or None if the probe fails.
+
+    The smart-HTTP ref advertisement is one small round-trip and does not
+    count against GitHub's REST quota, so it is a cheap way to detect the
+    already-up-to-date case before spending an API call.
+    """
+    try:
+        out = subprocess.check_output(
+            ["git", "ls-remote", "--heads", repo, f"refs/heads/{branch}"],
+            timeout=15,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    parts = out.split()
+    return parts[0].decode() if parts else None
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Update module hashes to latest commit on branch")
     p.add_argument(
@@ -108,6 +378,22 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--branch", default="main", help="Git branch to fetch latest commits from (default: main)")
     p.add_argument("--output", help="Optional output path to write updated JSON")
     p.add_argument("--fail-fast", action="store_true", help="Stop on first failure instead of continuing")
+    p.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=_MAX_FETCH_WORKERS,
+        help=f"Maximum parallel GitHub lookups (default: {_MAX_FETCH_WORKERS})",
+    )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the ETag cache next to the known_good file and force full lookups",
+    )
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-query every repo even when the cached sha is fresh and matches the stored hash",
+    )
     p.add_argument(
         "--no-gh",
         action="store_true",
@@ -136,55 +422,154 @@ def main(argv: list[str]) -> int:
 
     token = os.environ.get("GITHUB_TOKEN")
     failures = 0
-    # Default: use gh if available unless --no-gh specified
-    use_gh = (not args.no_gh) and shutil.which("gh") is not None
+    changed = False
+    # Prefer the pooled HTTP session when a token is available: one TLS
+    # handshake for all lookups instead of one gh subprocess per module
+    session = build_session(token) if token and requests is not None else None
+    # Resolve gh once; every which() call re-scans PATH
+    gh_path = shutil.which("gh")
+    # Fall back to gh if available unless --no-gh specified
+    use_gh = session is None and (not args.no_gh) and gh_path is not None
 
-    # If PyGithub is not available and gh CLI is not available, error out
-    if not use_gh and not HAS_PYGITHUB:
-        print("ERROR: Neither 'gh' CLI nor PyGithub library found.", file=sys.stderr)
-        print("Please install PyGithub (pip install PyGithub) or install GitHub CLI.", file=sys.stderr)
+    # If no usable fetch path is available, error out. find_spec checks
+    # availability without paying the full PyGithub import
+    if session is None and not use_gh and requests is None and importlib.util.find_spec("github") is None:
+        print("ERROR: Neither 'gh' CLI nor an HTTP client (requests/PyGithub) found.", file=sys.stderr)
+        print("Please install requests (pip install requests) or install GitHub CLI.", file=sys.stderr)
         return 3
 
-    if not args.no_gh and not use_gh:
+    if session is not None:
+        print("INFO: GITHUB_TOKEN set; using direct GitHub API over a pooled session", file=sys.stderr)
+    elif not args.no_gh and not use_gh:
         print("INFO: 'gh' CLI not found; using direct GitHub API", file=sys.stderr)
-    if args.no_gh and shutil.which("gh") is not None:
+    if args.no_gh and gh_path is not None:
         print("INFO: --no-gh specified; ignoring installed 'gh' CLI", file=sys.stderr)
 
-    for mod in known_good.modules.values():
+    sha_cache_path = Path(args.known_good).resolve().parent / _SHA_CACHE_NAME
+    sha_cache = {} if args.no_cache else _load_sha_cache(sha_cache_path)
+
+    # known_good.modules is nested {group: {name: Module}}; all_modules()
+    # yields the Module instances themselves. Modules sharing an
+    # (owner_repo, branch) pair are grouped so each pair is fetched once
+    # and the result broadcast to every module behind it.
+    # Per-module result lines are collected here and written in one batch at
+    # the end, sorted by module name: one write syscall instead of one per
+    # line, and deterministic output regardless of fetch completion order
+    log_lines: list[str] = []
+
+    keyed: dict[tuple[str, str], list] = {}
+    for mod in known_good.all_modules():
         if mod.pin_version:
-            print(f"{mod.name}: pinned, skipping")
+            log_lines.append(f"{mod.name}: pinned, skipping")
             continue
+        # A non-GitHub or malformed repo URL fails this module only; it is
+        # reported like any other per-module error instead of aborting the run
+        try:
+            owner_repo = mod.owner_repo
+        except ValueError as e:
+            failures += 1
+            print(f"ERROR {mod.name}: {e}", file=sys.stderr)
+            continue
+        keyed.setdefault((owner_repo, mod.branch if mod.branch else args.branch), []).append(mod)
+
+    # Fast path: when the cache saw this branch head recently and the stored
+    # hashes already match it, skip the network round-trip entirely
+    if not args.force and sha_cache:
+        now = time.time()
+        for pair in list(keyed):
+            owner_repo, branch = pair
+            cached = sha_cache.get(f"{owner_repo}@{branch}")
+            if (
+                cached
+                and cached.get("sha")
+                and now - cached.get("checked_at", 0) < _SHA_CACHE_TTL_SECONDS
+                and all(mod.hash == cached["sha"] for mod in keyed[pair])
+            ):
+                for mod in keyed.pop(pair):
+                    log_lines.append(f"{mod.name}: {mod.hash[:8]} (no update, cached)")
+
+    # With a session available, resolve everything in one batched GraphQL
+    # query first; anything it could not answer (or a failing query) falls
+    # through to the per-repo path below
+    resolved: dict[tuple[str, str], str] = {}
+    if session is not None and keyed:
+        try:
+            resolved = fetch_latest_commits_graphql(session, list(keyed))
+        except RuntimeError as e:
+            print(f"INFO: GraphQL batch lookup failed, falling back to REST: {e}", file=sys.stderr)
+    elif use_gh and keyed:
+        try:
+            resolved = fetch_latest_commits_gh_graphql(list(keyed), gh_path)
+        except RuntimeError as e:
+            print(f"INFO: gh graphql batch lookup failed, falling back to per-repo gh calls: {e}", file=sys.stderr)
 
+    def _fetch(owner_repo, branch, mods):
+        """Fetch the latest sha for one repo/branch pair; returns (mods, branch, sha_or_None, err)."""
         try:
-            branch = mod.branch if mod.branch else args.branch
+            sha = resolved.get((owner_repo, branch))
+            if sha:
+                return mods, branch, sha, None
+            if session is not None:
+                return mods, branch, fetch_latest_commit_http(session, owner_repo, branch, sha_cache), None
+            # The gh/PyGithub paths burn rate-limit budget per call; a quota-free
+            # ls-remote probe first catches the common already-up-to-date case
+            probed = probe_ls_remote(mods[0].repo, branch)
+            if probed is not None and all(mod.hash == probed for mod in mods):
+                return mods, branch, probed, None
             if use_gh:
-                latest = fetch_latest_commit_gh(mod.owner_repo, branch)
-            else:
-                latest = fetch_latest_commit(mod.owner_repo, branch, token)
-
-            old_hash = mod.hash
-            if latest != old_hash:
-                mod.hash = latest
-                mod.version = None  # Clear version when hash changes
-                if mod.version:
-                    print(f"{mod.name}: {mod.version} -> {latest[:8]} (branch {branch})")
-                else:
-                    print(f"{mod.name}: {old_hash[:8]} -> {latest[:8]} (branch {branch})")
-            else:
-                print(f"{mod.name}: {old_hash[:8]} (no update)")
+                return mods, branch, fetch_latest_commit_gh(owner_repo, branch, gh_path), None
+            return mods, branch, fetch_latest_commit(owner_repo, branch, token), None
         except Exception as e:  # noqa: BLE001
-            failures += 1
-            print(f"ERROR {mod.name}: {e}", file=sys.stderr)
-            if args.fail_fast:
-                break
+            return mods, branch, None, e
+
+    # The fetches are network-bound and independent, so overlap them in a
+    # thread pool instead of paying one GitHub round-trip per repo
+    with ThreadPoolExecutor(max_workers=min(max(args.max_concurrent, 1), len(keyed) or 1)) as executor:
+        futures = [executor.submit(_fetch, owner_repo, branch, mods) for (owner_repo, branch), mods in keyed.items()]
+        for future in as_completed(futures):
+            mods, branch, latest, err = future.result()
+            if err is not None:
+                failures += 1
+                print(f"ERROR {', '.join(mod.name for mod in mods)}: {err}", file=sys.stderr)
+                if args.fail_fast:
+                    executor.shutdown(cancel_futures=True)
+                    break
+                continue
+
+            for mod in mods:
+                old_hash = mod.hash
+                if latest != old_hash:
+                    changed = True
+                    mod.hash = latest
+                    mod.version = None  # Clear version when hash changes
+                    if mod.version:
+                        log_lines.append(f"{mod.name}: {mod.version} -> {latest[:8]} (branch {branch})")
+                    else:
+                        log_lines.append(f"{mod.name}: {old_hash[:8]} -> {latest[:8]} (branch {branch})")
+                else:
+                    log_lines.append(f"{mod.name}: {old_hash[:8]} (no update)")
+
+    if log_lines:
+        log_lines.sort()
+        sys.stdout.write("\n".join(log_lines) + "\n")
+
+    if not args.no_cache:
+        _store_sha_cache(sha_cache_path, sha_cache)
 
     if args.output:
-        try:
-            known_good.write(Path(args.output))
-            print(f"Updated JSON written to {args.output}")
-        except OSError as e:
-            print(f"ERROR: Failed writing output file: {e}", file=sys.stderr)
-            return 3
+        output_path = Path(args.output)
+        # Skip the rewrite on a no-op run to keep the file mtime stable for
+        # downstream jobs -- but only when the file already exists: CI reads
+        # the output unconditionally after every run
+        if changed or not output_path.exists():
+            try:
+                known_good.write(output_path)
+                print(f"Updated JSON written to {args.output}")
+            except OSError as e:
+                print(f"ERROR: Failed writing output file: {e}", file=sys.stderr)
+                return 3
+        else:
+            print("No changes; existing output left untouched.")
 
     if failures:
         print(f"Completed with {failures} failure(s).", file=sys.stderr)
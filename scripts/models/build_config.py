@@ -36,11 +36,13 @@ def load_build_config(config_path: Path) -> Dict[str, BuildModuleConfig]:
     Returns:
         Dictionary mapping module names to BuildModuleConfig instances
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Build config file not found: {config_path}")
-
-    with open(config_path, "r") as f:
-        data = json.load(f)
+    # Let open report the missing file instead of stat-ing first; one syscall
+    # fewer and no window between check and use
+    try:
+        with open(config_path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Build config file not found: {config_path}") from None
 
     modules = data.get("modules", {})
     return {
@@ -12,10 +12,25 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import argparse
+import io
 import os
+import shutil
 import sys
 
 
+def _scan_summaries(directory: str):
+    """Yield paths of build_summary-*.md files under directory, recursively.
+
+    scandir reports entry types straight from the directory read, so the
+    walk needs no per-entry stat calls the way os.walk does.
+    """
+    for entry in os.scandir(directory):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_summaries(entry.path)
+        elif entry.name.startswith("build_summary-") and entry.name.endswith(".md"):
+            yield entry.path
+
+
 def format_status(result: str) -> str:
     status_map = {
         "success": "✅ **SUCCESS**",
@@ -65,33 +80,34 @@ def main() -> int:
     docs_result = args.docs_result
     logs_dir = args.logs_dir
 
-    out = sys.stdout
-
-    out.write("## Overall Status\n\n")
-
-    out.write(f"- Integration Test: {format_status(integration_result)}\n")
-    out.write(f"- Documentation Generation: {format_status(docs_result)}\n")
-
-    out.write("\n---\n\n")
-    out.write("## Integration Test Summary\n\n")
-
-    summaries = []
-    if os.path.isdir(logs_dir):
-        for root, _, files in os.walk(logs_dir):
-            for name in files:
-                if name.startswith("build_summary-") and name.endswith(".md"):
-                    summaries.append(os.path.join(root, name))
-
-    if not summaries:
-        out.write(f"No build_summary-*.md files found in '{logs_dir}'.\n\n")
-        return 0
-    for summary_file in sorted(summaries):
-        filename = os.path.basename(summary_file)
-        config_name = filename[len("build_summary-") : -len(".md")]
-        out.write(f"### Configuration: {config_name}\n\n")
-        with open(summary_file, "r", encoding="utf-8", errors="replace") as handle:
-            out.write(handle.read())
-        out.write("\n\n")
+    # Buffer the many small writes into 64KB chunks; stdout in CI is usually
+    # line-buffered, which would otherwise mean one syscall per write
+    out = io.TextIOWrapper(io.BufferedWriter(sys.stdout.buffer, 65536), encoding="utf-8", write_through=False)
+
+    try:
+        out.write("## Overall Status\n\n")
+
+        out.write(f"- Integration Test: {format_status(integration_result)}\n")
+        out.write(f"- Documentation Generation: {format_status(docs_result)}\n")
+
+        out.write("\n---\n\n")
+        out.write("## Integration Test Summary\n\n")
+
+        summaries = sorted(_scan_summaries(logs_dir)) if os.path.isdir(logs_dir) else []
+
+        if not summaries:
+            out.write(f"No build_summary-*.md files found in '{logs_dir}'.\n\n")
+            return 0
+        for summary_file in summaries:
+            filename = os.path.basename(summary_file)
+            config_name = filename[len("build_summary-") : -len(".md")]
+            out.write(f"### Configuration: {config_name}\n\n")
+            with open(summary_file, "r", encoding="utf-8", errors="replace") as handle:
+                # Stream in 64KB chunks; memory stays bounded however large the log is
+                shutil.copyfileobj(handle, out, 65536)
+            out.write("\n\n")
+    finally:
+        out.flush()
 
     return 0
 
@@ -11,9 +11,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import argparse
+import functools
+import os
 import re
-import select
+import selectors
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from pprint import pprint
@@ -22,6 +26,24 @@ from subprocess import PIPE, Popen
 from known_good.models.known_good import load_known_good
 from known_good.models.module import Module
 
+# Compiled once at import; the extract_* helpers run per module.
+# The count/percentage patterns are fused into one alternation each so a
+# single finditer pass replaces four to five separate search scans.
+_UT_SUMMARY_LINE_RE = re.compile(r"Test cases: finished.*")
+_UT_COUNTS_RE = re.compile(
+    r"(?:(?P<passed>\d+) passing|(?P<skipped>\d+) skipped|(?P<failed>\d+) failing|out of (?P<total>\d+) test cases)"
+)
+
+# Coverage percentages in genhtml output, e.g.
+# "  lines......: 93.0% (1234 of 1327 lines)", plus the rust_coverage_report
+# "line coverage: 81.2%" form
+_COV_SUMMARY_RE = re.compile(
+    r"(?:lines\.+:\s+(?P<lines>[\d.]+%)"
+    r"|functions\.+:\s+(?P<functions>[\d.]+%)"
+    r"|branches\.+:\s+(?P<branches>[\d.]+%)"
+    r"|line coverage:\s+(?P<rust_lines>[\d.]+%))"
+)
+
 
 @dataclass
 class ProcessResult:
@@ -65,15 +87,30 @@ def run_unit_test_with_coverage(module: Module) -> dict[str, str | int]:
     return {**summary, "exit_code": result.exit_code}
 
 
-def run_cpp_coverage_extraction(module: Module, output_path: Path) -> int:
+def run_cpp_coverage_extraction(module: Module, output_path: Path, coverage_dat: Path | None = None) -> int:
     print_centered("QR: Running cpp coverage analysis")
 
-    result_cpp = cpp_coverage(module, output_path)
+    result_cpp = cpp_coverage(module, output_path, coverage_dat)
     summary = extract_coverage_summary(result_cpp.stdout)
 
     return {**summary, "exit_code": result_cpp.exit_code}
 
 
+def snapshot_cpp_coverage_report(module: Module, artifact_dir: Path) -> Path:
+    """Copy the shared Bazel coverage report into the module's output directory.
+
+    Each bazel coverage run overwrites _coverage_report.dat, so the per-module
+    snapshot is what allows genhtml extraction to run after (and independently
+    of) the remaining test runs.
+    """
+    output_dir = artifact_dir / "cpp" / module.name
+    output_dir.mkdir(parents=True, exist_ok=True)
+    snapshot = output_dir / "_coverage_report.dat"
+    shutil.copyfile(f"{_bazel_output_path()}/_coverage/_coverage_report.dat", snapshot)
+    # genhtml runs with cwd set to the bazel output base; hand it an absolute path
+    return snapshot.resolve()
+
+
 def run_rust_coverage_extraction(module: Module, output_path: Path) -> int:
     print_centered("QR: Running rust coverage analysis")
 
@@ -83,20 +120,33 @@ def run_rust_coverage_extraction(module: Module, output_path: Path) -> int:
     return {**summary, "exit_code": result_rust.exit_code}
 
 
-def cpp_coverage(module: Module, artifact_dir: Path) -> ProcessResult:
+@functools.lru_cache(maxsize=1)
+def _bazel_output_path() -> str:
+    """Workspace-global bazel output_path; cached so N modules pay one call."""
+    return run_command(["bazel", "info", "output_path"]).stdout.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _bazel_output_base() -> str:
+    """Workspace-global bazel output_base; cached so N modules pay one call."""
+    return run_command(["bazel", "info", "output_base"]).stdout.strip()
+
+
+def cpp_coverage(module: Module, artifact_dir: Path, coverage_dat: Path | None = None) -> ProcessResult:
     # .dat files are already generated in UT step
 
     # Run genhtml to generate the HTML report and get the summary
     # Create dedicated output directory for this module's coverage reports
     output_dir = artifact_dir / "cpp" / module.name
     output_dir.mkdir(parents=True, exist_ok=True)
-    # Find input locations
-    bazel_coverage_output_directory = run_command(["bazel", "info", "output_path"]).stdout.strip()
-    bazel_source_directory = run_command(["bazel", "info", "output_base"]).stdout.strip()
+    # Find input locations; both are workspace-global, so the cached helpers
+    # spawn the bazel client only once per run instead of twice per module
+    bazel_coverage_output_directory = _bazel_output_path()
+    bazel_source_directory = _bazel_output_base()
 
     genhtml_call = [
         "genhtml",
-        f"{bazel_coverage_output_directory}/_coverage/_coverage_report.dat",
+        str(coverage_dat) if coverage_dat else f"{bazel_coverage_output_directory}/_coverage/_coverage_report.dat",
         f"--output-directory={output_dir}",
         "--show-details",
         "--legend",
@@ -135,42 +185,35 @@ def generate_markdown_report(
     output_path: Path = Path("unit_test_summary.md"),
 ) -> None:
     # Build header and separator
-    title = f"# {title}\n"
     header = "| " + " | ".join(columns) + " |"
     separator = "| " + " | ".join("---" for _ in columns) + " |"
 
-    # Build rows
-    rows = []
-    for name, stats in data.items():
-        rows.append("| " + " | ".join([name] + [str(stats.get(col, "")) for col in columns[1:]]) + " |")
-
-    md = "\n".join([title, header, separator] + rows + [""])
-    output_path.write_text(md)
+    # Build rows lazily and join everything once; no intermediate row list
+    value_columns = columns[1:]
+    rows = (
+        "| " + " | ".join((name, *(str(stats.get(col, "")) for col in value_columns))) + " |"
+        for name, stats in data.items()
+    )
+    md = "\n".join((f"# {title}\n", header, separator, *rows, ""))
+    # write_bytes skips the text-mode newline translation pass
+    output_path.write_bytes(md.encode())
 
 
 def extract_ut_summary(logs: str) -> dict[str, int]:
     summary = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
 
-    pattern_summary_line = re.compile(r"Test cases: finished.*")
-    if match := pattern_summary_line.search(logs):
+    if match := _UT_SUMMARY_LINE_RE.search(logs):
         summary_line = match.group(0)
     else:
         print_centered("QR: Summary line not found in logs")
         return summary
 
-    pattern_passed = re.compile(r"(\d+) passing")
-    pattern_skipped = re.compile(r"(\d+) skipped")
-    pattern_failed = re.compile(r"(\d+) failing")
-    pattern_total = re.compile(r"out of (\d+) test cases")
-
-    if match := pattern_passed.search(summary_line):
-        summary["passed"] = int(match.group(1))
-    if match := pattern_skipped.search(summary_line):
-        summary["skipped"] = int(match.group(1))
-    if match := pattern_failed.search(summary_line):
-        summary["failed"] = int(match.group(1))
-    if match := pattern_total.search(summary_line):
-        summary["total"] = int(match.group(1))
+    # One pass over the summary line; lastgroup names the alternative that
+    # matched, setdefault keeps the first occurrence like search did
+    found: dict[str, int] = {}
+    for match in _UT_COUNTS_RE.finditer(summary_line):
+        found.setdefault(match.lastgroup, int(match.group(match.lastgroup)))
+    summary.update(found)
     return summary
 
 
@@ -186,22 +229,16 @@ def extract_coverage_summary(logs: str) -> dict[str, str]:
     """
     summary = {"lines": "", "functions": "", "branches": ""}
 
-    # Pattern to match coverage percentages in genhtml output
-    # Example: "  lines......: 93.0% (1234 of 1327 lines)"
-    pattern_cpp_lines = re.compile(r"lines\.+:\s+([\d.]+%)")
-    pattern_cpp_functions = re.compile(r"functions\.+:\s+([\d.]+%)")
-    pattern_cpp_branches = re.compile(r"branches\.+:\s+([\d.]+%)")
-    if match := pattern_cpp_lines.search(logs):
-        summary["lines"] = match.group(1)
-    if match := pattern_cpp_functions.search(logs):
-        summary["functions"] = match.group(1)
-    if match := pattern_cpp_branches.search(logs):
-        summary["branches"] = match.group(1)
-
-    # Rust coverage currently returns only line coverage
-    pattern_rust_lines = re.compile(r"line coverage:\s+([\d.]+%)")
-    if match := pattern_rust_lines.search(logs):
-        summary["lines"] = match.group(1)
+    # One pass over the logs; setdefault keeps the first occurrence per
+    # alternative like the old per-pattern search calls did
+    found: dict[str, str] = {}
+    for match in _COV_SUMMARY_RE.finditer(logs):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+
+    # Rust coverage currently returns only line coverage and takes precedence
+    summary["lines"] = found.get("rust_lines") or found.get("lines", "")
+    summary["functions"] = found.get("functions", "")
+    summary["branches"] = found.get("branches", "")
 
     return summary
 
@@ -224,33 +261,33 @@ def run_command(command: list[str], **kwargs) -> ProcessResult:
     print(f"{' '.join(command)}")
 
     with Popen(command, stdout=PIPE, stderr=PIPE, text=True, bufsize=1, **kwargs) as p:
-        # Use select to read from both streams without blocking
-        streams = {
-            p.stdout: (stdout_data, sys.stdout),
-            p.stderr: (stderr_data, sys.stderr),
-        }
+        # Read both streams through a selector with no timeout: the kernel
+        # wakes us only when data arrives, instead of polling every 100ms
+        # for the whole (possibly very long) Bazel run
+        sel = selectors.DefaultSelector()
+        sel.register(p.stdout, selectors.EVENT_READ, (stdout_data, sys.stdout))
+        sel.register(p.stderr, selectors.EVENT_READ, (stderr_data, sys.stderr))
 
         try:
-            while p.poll() is None or streams:
-                # Check which streams have data available
-                readable, _, _ = select.select(list(streams.keys()), [], [], 0.1)
-
-                for stream in readable:
-                    line = stream.readline()
+            while sel.get_map():
+                for key, _ in sel.select():
+                    line = key.fileobj.readline()
                     if line:
-                        storage, output_stream = streams[stream]
+                        storage, output_stream = key.data
                         print(line, end="", file=output_stream, flush=True)
                         storage.append(line)
                     else:
                         # Stream closed
-                        del streams[stream]
+                        sel.unregister(key.fileobj)
 
-            exit_code = p.returncode
+            exit_code = p.wait()
 
         except Exception:
             p.kill()
             p.wait()
             raise
+        finally:
+            sel.close()
 
     return ProcessResult(stdout="".join(stdout_data), stderr="".join(stderr_data), exit_code=exit_code)
 
@@ -292,6 +329,15 @@ def main() -> bool:
     if args.modules_to_test:
         print_centered(f"QR: User requested tests only for specified modules: {', '.join(args.modules_to_test)}")
 
+    # The bazel runs (tests, rust coverage) stay serial: they share one bazel
+    # server and cache. The genhtml extraction is independent per module once
+    # the shared coverage report is snapshotted, so it runs in parallel after
+    # the test loop.
+    tested_modules: list[Module] = []
+    cpp_jobs: list[tuple[Module, Path]] = []
+    cpp_results: dict[str, dict] = {}
+    rust_results: dict[str, dict] = {}
+
     for module in known.modules["target_sw"].values():
         if args.modules_to_test and module.name not in args.modules_to_test:
             print_centered(f"QR: Skipping module {module.name}")
@@ -299,11 +345,16 @@ def main() -> bool:
 
         print_centered(f"QR: Testing module: {module.name}")
         unit_tests_summary[module.name] = run_unit_test_with_coverage(module=module)
+        tested_modules.append(module)
 
         if "cpp" in module.metadata.langs:
-            coverage_summary[f"{module.name}_cpp"] = run_cpp_coverage_extraction(
-                module=module, output_path=args.coverage_output_dir
-            )
+            # A missing coverage report fails this module's extraction only;
+            # the remaining modules and the markdown reports still run
+            try:
+                cpp_jobs.append((module, snapshot_cpp_coverage_report(module, args.coverage_output_dir)))
+            except OSError as e:
+                print_centered(f"QR: No coverage report to snapshot for module {module.name}: {e}")
+                cpp_results[module.name] = {"lines": "", "functions": "", "branches": "", "exit_code": 1}
 
         if "rust" in module.metadata.langs:
             DISABLED_RUST_COVERAGE = [
@@ -313,12 +364,28 @@ def main() -> bool:
             if module.name in DISABLED_RUST_COVERAGE:
                 print_centered(f"QR: Skipping rust coverage extraction for module {module.name} due to known issues")
                 continue
-            coverage_summary[f"{module.name}_rust"] = run_rust_coverage_extraction(
+            rust_results[module.name] = run_rust_coverage_extraction(
                 module=module, output_path=args.coverage_output_dir
             )
 
         print_centered(f"QR: Finished testing module: {module.name}")
 
+    if cpp_jobs:
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(cpp_jobs))) as executor:
+            futures = {
+                executor.submit(run_cpp_coverage_extraction, module, args.coverage_output_dir, dat): module
+                for module, dat in cpp_jobs
+            }
+            for future in as_completed(futures):
+                cpp_results[futures[future].name] = future.result()
+
+    # Merge in module order so the markdown report stays deterministic
+    for module in tested_modules:
+        if module.name in cpp_results:
+            coverage_summary[f"{module.name}_cpp"] = cpp_results[module.name]
+        if module.name in rust_results:
+            coverage_summary[f"{module.name}_rust"] = rust_results[module.name]
+
     generate_markdown_report(
         unit_tests_summary,
         title="Unit Test Execution Summary",
@@ -14,10 +14,32 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
-from urllib.parse import urlparse
+
+_GH_PREFIX = "https://github.com/"
+
+
+@functools.lru_cache(maxsize=None)
+def _owner_repo(repo_url: str) -> str:
+    """Parse 'owner/repo' out of a GitHub HTTPS URL, memoized per URL.
+
+    The accepted format is the narrow https://github.com/<owner>/<repo>[.git]
+    shape, so a prefix check plus one partition replaces urlparse and its
+    ParseResult allocation on this hot path.
+    """
+    if not repo_url.startswith(_GH_PREFIX):
+        raise ValueError(f"Not a GitHub URL: {repo_url}")
+
+    path = repo_url[len(_GH_PREFIX) :].removesuffix(".git")
+
+    owner, sep, repo = path.partition("/")
+    if not sep or not owner or not repo or "/" in repo:
+        raise ValueError(f"Cannot parse owner/repo from: {repo_url}")
+
+    return f"{owner}/{repo}"
 
 
 @dataclass
@@ -102,14 +124,7 @@ class Module:
     @property
     def owner_repo(self) -> str:
         """Return 'owner/repo' extracted from a GitHub HTTPS URL."""
-        parsed = urlparse(self.repo)
-        if parsed.netloc != "github.com":
-            raise ValueError(f"Not a GitHub URL: {self.repo}")
-        path = parsed.path.lstrip("/").removesuffix(".git")
-        parts = path.split("/", 2)
-        if len(parts) != 2:
-            raise ValueError(f"Cannot parse owner/repo from: {self.repo}")
-        return f"{parts[0]}/{parts[1]}"
+        return _owner_repo(self.repo)
 
     def to_dict(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {"repo": self.repo}